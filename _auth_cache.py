@@ -0,0 +1,50 @@
+"""
+Shared credentials for the smoke test scripts.
+
+Scripts run in the same process reuse one GoogleWorkspaceAuth, so only the
+first one loads the token file, and the token is only refreshed once it
+is about to expire. They also share one authorized transport, so their
+clients reuse kept-alive connections to googleapis.com.
+"""
+
+import functools
+
+from google.oauth2.credentials import Credentials
+
+from src.google_workspace_agent.auth import GoogleWorkspaceAuth
+from src.google_workspace_agent.service_client import create_authorized_http
+
+@functools.lru_cache(maxsize=1)
+def _shared_auth() -> GoogleWorkspaceAuth:
+    """
+    Get the process-wide authentication manager.
+    
+    Returns:
+        GoogleWorkspaceAuth shared by all scripts
+    """
+    return GoogleWorkspaceAuth()
+
+def get_shared_credentials() -> Credentials:
+    """
+    Get valid credentials shared across scripts.
+    
+    Credentials still valid in memory are returned as-is; expired ones are
+    refreshed first.
+    
+    Returns:
+        Authenticated Google API credentials
+    """
+    return _shared_auth().authenticate()
+
+@functools.lru_cache(maxsize=1)
+def get_shared_http():
+    """
+    Get the authorized transport shared across scripts.
+    
+    The transport signs requests with the shared credentials and refreshes
+    them itself when they expire.
+    
+    Returns:
+        Authorized transport to pass as ``http`` to service clients
+    """
+    return create_authorized_http(get_shared_credentials())
@@ -0,0 +1,15 @@
+"""
+Pytest configuration for the live smoke tests in the root scripts.
+"""
+
+import pytest
+
+def pytest_collection_modifyitems(config, items):
+    """Skip smoke tests, which call the real Google APIs, unless selected with ``-m smoke``."""
+    if 'smoke' in (config.getoption('markexpr') or ''):
+        return
+    
+    skip_smoke = pytest.mark.skip(reason='live smoke test; run with -m smoke')
+    for item in items:
+        if 'smoke' in item.keywords:
+            item.add_marker(skip_smoke)
@@ -0,0 +1,25 @@
+import asyncio
+import logging
+
+from _auth_cache import get_shared_http
+import test_docs_client
+import test_drive_client
+import test_gmail_client
+import test_sheets_client
+
+async def run():
+    # Authenticate and build the transport up front, so the scripts running
+    # side by side share one of each instead of racing to create them
+    get_shared_http()
+    
+    return await asyncio.gather(
+        test_drive_client.main(),
+        asyncio.to_thread(test_gmail_client.main),
+        asyncio.to_thread(test_sheets_client.main),
+        asyncio.to_thread(test_docs_client.main),
+        return_exceptions=True
+    )
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(name)s: %(message)s')
+    asyncio.run(run())
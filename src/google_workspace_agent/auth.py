@@ -4,14 +4,28 @@ Authentication module for Google Workspace Agent.
 Handles OAuth 2.0 authentication and token management for Google Workspace services.
 """
 
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 import os
 from pathlib import Path
 import json
+import logging
+import tempfile
+import threading
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+from google.auth.exceptions import RefreshError
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+import requests
+
+# Shared transport for token refreshes so the HTTPS connection to the
+# OAuth token endpoint is kept alive between refreshes
+_REFRESH_REQUEST = Request(session=requests.Session())
 
 class GoogleWorkspaceAuth:
     """
@@ -41,6 +55,14 @@ class GoogleWorkspaceAuth:
         self.credentials_path = credentials_path or self._default_credentials_path()
         self.token_path = token_path or self._default_token_path()
         self.credentials = None
+        
+        # Modification time of the token file when it was last read or written
+        self._token_mtime: Optional[float] = None
+        
+        # Serializes token refresh and token file writes across threads
+        self._lock = threading.Lock()
+        
+        self.logger = logging.getLogger(__name__)
     
     @staticmethod
     def _default_credentials_path() -> str:
@@ -62,37 +84,138 @@ class GoogleWorkspaceAuth:
         """
         return str(Path.home() / '.google' / 'workspace_agent_token.json')
     
+    def _read_token_mtime(self) -> Optional[float]:
+        """
+        Get the modification time of the token file.
+        
+        Returns:
+            File modification time, or None if the file does not exist
+        """
+        try:
+            return os.stat(self.token_path).st_mtime
+        except FileNotFoundError:
+            return None
+    
+    @contextmanager
+    def _token_file_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the token file across processes.
+        
+        The lock is taken on a separate ``.lock`` file, since the token file
+        itself is replaced rather than rewritten. Without ``fcntl`` only the
+        in-process lock applies.
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self.token_path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _save_token(self, credentials: Credentials) -> None:
+        """
+        Write the token file atomically.
+        
+        The token is written to a temporary file in the same directory and
+        moved into place, so readers never see a partially written token.
+        
+        Args:
+            credentials: Credentials to persist
+        """
+        directory = os.path.dirname(os.path.abspath(self.token_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as token:
+                token.write(credentials.to_json())
+                token.flush()
+                os.fsync(token.fileno())
+            os.replace(tmp_path, self.token_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
     def authenticate(self) -> Credentials:
         """
         Perform OAuth 2.0 authentication flow.
         
+        Credentials that are already loaded and still valid are returned
+        as-is unless the token file was changed by another process; the
+        token file is only rewritten when the token changed.
+        
+        Returns:
+            Authenticated Google API credentials
+        """
+        with self._lock:
+            token_mtime = self._read_token_mtime()
+            token_file_changed = (
+                self._token_mtime is not None and token_mtime != self._token_mtime
+            )
+            
+            # Reuse in-memory credentials while they are still valid
+            if self.credentials and self.credentials.valid and not token_file_changed:
+                return self.credentials
+            
+            with self._token_file_lock():
+                return self._load_or_refresh()
+    
+    def _load_or_refresh(self) -> Credentials:
+        """
+        Load, refresh or obtain credentials, persisting them if they changed.
+        
+        Must be called with the token file lock held. The token file is
+        checked again under the lock, so when several processes find the
+        token expired, only the first refreshes it and the others load the
+        token it wrote.
+        
         Returns:
             Authenticated Google API credentials
         """
-        credentials = None
+        token_mtime = self._read_token_mtime()
+        token_file_changed = (
+            self._token_mtime is not None and token_mtime != self._token_mtime
+        )
+        
+        credentials = None if token_file_changed else self.credentials
+        token_changed = False
         
         # Try to load existing credentials
-        if os.path.exists(self.token_path):
+        if credentials is None and token_mtime is not None:
             credentials = Credentials.from_authorized_user_file(
                 self.token_path, self.SCOPES
             )
         
-        # Refresh if credentials are invalid or expired
-        if credentials and credentials.valid:
-            if credentials.expired and credentials.refresh_token:
-                credentials.refresh(Request())
-        else:
-            # Initiate new authentication flow
+        # Refresh if credentials are expired, otherwise re-authenticate
+        if credentials and credentials.expired and credentials.refresh_token:
+            try:
+                credentials.refresh(_REFRESH_REQUEST)
+                token_changed = True
+            except RefreshError as e:
+                # A revoked or expired refresh token needs a new sign-in
+                self.logger.warning(f"Failed to refresh credentials: {e}")
+                credentials = None
+        
+        if not token_changed and not (credentials and credentials.valid):
+            # Initiate new authentication flow; the OAuth flow library is
+            # only imported here, since runs with a saved token never need it
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            
             flow = InstalledAppFlow.from_client_secrets_file(
                 self.credentials_path, self.SCOPES
             )
             credentials = flow.run_local_server(port=0)
+            token_changed = True
         
         # Save the credentials for the next run
-        with open(self.token_path, 'w') as token:
-            token.write(credentials.to_json())
+        if token_changed:
+            self._save_token(credentials)
+            token_mtime = self._read_token_mtime()
         
         self.credentials = credentials
+        self._token_mtime = token_mtime
         return credentials
     
     def get_credentials(self) -> Credentials:
@@ -110,6 +233,9 @@ class GoogleWorkspaceAuth:
         """
         Revoke and remove stored credentials.
         """
-        if os.path.exists(self.token_path):
+        try:
             os.unlink(self.token_path)
+        except FileNotFoundError:
+            pass
         self.credentials = None
+        self._token_mtime = None
@@ -15,6 +15,10 @@ import logging
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+import requests
+
+# Reused for every refresh instead of opening a new session each time
+_REFRESH_REQUEST = Request(session=requests.Session())
 
 class GoogleWorkspaceAuthCLI:
     """
@@ -51,6 +55,11 @@ class GoogleWorkspaceAuthCLI:
         # Set paths
         self.credentials_path = credentials_path or self._default_credentials_path()
         self.token_path = token_path or self._default_token_path()
+        
+        # Credentials from the last successful authentication, and the token
+        # file modification time they correspond to
+        self._cached_creds: Optional[Credentials] = None
+        self._token_mtime: Optional[float] = None
     
     @staticmethod
     def _default_credentials_path() -> str:
@@ -72,6 +81,18 @@ class GoogleWorkspaceAuthCLI:
         """
         return os.path.expanduser('~/.google/workspace_agent_token.json')
     
+    def _read_token_mtime(self) -> Optional[float]:
+        """
+        Get the modification time of the token file.
+        
+        Returns:
+            File modification time, or None if the file does not exist
+        """
+        try:
+            return os.stat(self.token_path).st_mtime
+        except FileNotFoundError:
+            return None
+    
     def authenticate(self) -> Credentials:
         """
         Perform OAuth 2.0 authentication flow.
@@ -79,10 +100,18 @@ class GoogleWorkspaceAuthCLI:
         Returns:
             Authenticated Google API credentials
         """
-        credentials = None
+        token_mtime = self._read_token_mtime()
+        token_file_unchanged = token_mtime == self._token_mtime
+        
+        # Reuse cached credentials unless another process updated the token
+        if self._cached_creds and self._cached_creds.valid and token_file_unchanged:
+            return self._cached_creds
+        
+        credentials = self._cached_creds if token_file_unchanged else None
+        token_changed = False
         
         # Try to load existing credentials
-        if os.path.exists(self.token_path):
+        if credentials is None and token_mtime is not None:
             try:
                 credentials = Credentials.from_authorized_user_file(
                     self.token_path, self.SCOPES
@@ -90,14 +119,16 @@ class GoogleWorkspaceAuthCLI:
             except Exception as e:
                 self.logger.warning(f"Failed to load existing credentials: {e}")
         
-        # Refresh if credentials are invalid or expired
-        if credentials and credentials.valid:
-            if credentials.expired and credentials.refresh_token:
-                try:
-                    credentials.refresh(Request())
-                except Exception as e:
-                    self.logger.warning(f"Failed to refresh credentials: {e}")
-                    credentials = None
+        # Refresh if credentials are expired
+        if credentials and credentials.expired and credentials.refresh_token:
+            try:
+                credentials.refresh(_REFRESH_REQUEST)
+                token_changed = True
+            except Exception as e:
+                self.logger.warning(f"Failed to refresh credentials: {e}")
+                credentials = None
+        elif credentials and not credentials.valid:
+            credentials = None
         
         # Initiate new authentication flow if no valid credentials
         if not credentials:
@@ -106,16 +137,22 @@ class GoogleWorkspaceAuthCLI:
                     self.credentials_path, self.SCOPES
                 )
                 credentials = flow.run_local_server(port=0)
+                token_changed = True
             except Exception as e:
                 self.logger.error(f"Authentication failed: {e}")
                 sys.exit(1)
         
-        # Ensure token directory exists
-        os.makedirs(os.path.dirname(self.token_path), exist_ok=True)
+        if token_changed:
+            # Ensure token directory exists
+            os.makedirs(os.path.dirname(self.token_path), exist_ok=True)
+            
+            # Save the credentials for the next run
+            with open(self.token_path, 'w') as token:
+                token.write(credentials.to_json())
+            token_mtime = self._read_token_mtime()
         
-        # Save the credentials for the next run
-        with open(self.token_path, 'w') as token:
-            token.write(credentials.to_json())
+        self._cached_creds = credentials
+        self._token_mtime = token_mtime
         
         self.logger.info("Authentication successful!")
         return credentials
@@ -124,10 +161,14 @@ class GoogleWorkspaceAuthCLI:
         """
         Revoke and remove stored credentials.
         """
+        self._cached_creds = None
+        self._token_mtime = None
+        
         try:
-            if os.path.exists(self.token_path):
-                os.unlink(self.token_path)
-                self.logger.info("Credentials revoked and token file removed.")
+            os.unlink(self.token_path)
+            self.logger.info("Credentials revoked and token file removed.")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Error revoking credentials: {e}")
     
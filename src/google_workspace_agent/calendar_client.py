@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from .service_client import BaseServiceClient
 
@@ -20,24 +21,33 @@ class CalendarClient(BaseServiceClient):
     Provides methods for calendar and event-related operations.
     """
     
-    def __init__(self, credentials: Credentials):
+    # Calendar accepts at most 50 sub-requests per batch request
+    MAX_BATCH_SIZE = 50
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 http: Optional[Any] = None):
         """
         Initialize Calendar service client.
         
         Args:
             credentials: Google OAuth 2.0 credentials
+            http: Optional authorized transport shared with other clients
         """
         super().__init__(
             credentials=credentials, 
             service_name='calendar',
-            service_version='v3'
+            service_version='v3',
+            http=http
         )
     
     def list_items(self, 
                    max_results: Optional[int] = 10, 
                    time_min: Optional[str] = None,
                    time_max: Optional[str] = None,
-                   single_events: bool = True) -> List[Dict[str, Any]]:
+                   single_events: bool = True,
+                   fields: str = 'items(id,summary,location,start,end,attendees/email,htmlLink),nextPageToken',
+                   max_pages: Optional[int] = 1) -> List[Dict[str, Any]]:
         """
         List calendar events.
         
@@ -46,6 +56,9 @@ class CalendarClient(BaseServiceClient):
             time_min: Lower bound for event start time (ISO 8601 format)
             time_max: Upper bound for event start time (ISO 8601 format)
             single_events: Whether to expand recurring events
+            fields: Partial response mask selecting the fields to return
+            max_pages: Maximum number of result pages to fetch, each of up
+                to max_results items (None for all pages)
         
         Returns:
             List of calendar events
@@ -55,7 +68,8 @@ class CalendarClient(BaseServiceClient):
             list_params = {
                 'calendarId': 'primary',
                 'maxResults': max_results,
-                'singleEvents': single_events
+                'singleEvents': single_events,
+                'fields': fields
             }
             
             # Add optional time filters
@@ -65,15 +79,48 @@ class CalendarClient(BaseServiceClient):
             if time_max:
                 list_params['timeMax'] = time_max
             
-            # Execute list request
-            results = self._service.events().list(**list_params).execute()
-            
-            # Extract and return events
-            return results.get('items', [])
+            # Execute list request, following next pages as needed
+            events = self._collection('events')
+            return list(self._paginate(
+                events, 
+                events.list(**list_params), 
+                'items', 
+                max_pages
+            ))
         
         except HttpError as error:
             self.handle_api_error(error)
     
+    def _get_request(self, event_id: str) -> HttpRequest:
+        """
+        Build the request that retrieves a specific calendar event.
+        
+        Args:
+            event_id: Unique identifier for the event
+        
+        Returns:
+            Unexecuted events.get request
+        """
+        return self._collection('events').get(
+            calendarId='primary', 
+            eventId=event_id
+        )
+    
+    def _delete_request(self, event_id: str) -> HttpRequest:
+        """
+        Build the request that deletes a specific calendar event.
+        
+        Args:
+            event_id: Unique identifier for the event
+        
+        Returns:
+            Unexecuted events.delete request
+        """
+        return self._collection('events').delete(
+            calendarId='primary', 
+            eventId=event_id
+        )
+    
     def get_item(self, event_id: str) -> Dict[str, Any]:
         """
         Retrieve a specific calendar event.
@@ -85,10 +132,10 @@ class CalendarClient(BaseServiceClient):
             Detailed event information
         """
         try:
-            event = self._service.events().get(
-                calendarId='primary', 
-                eventId=event_id
-            ).execute()
+            event = self._single_flight(
+                ('get', event_id), 
+                lambda: self._get_request(event_id).execute()
+            )
             
             return event
         
@@ -130,7 +177,7 @@ class CalendarClient(BaseServiceClient):
                 event_data['attendees'] = [{'email': email} for email in attendees]
             
             # Create event
-            event = self._service.events().insert(
+            event = self._collection('events').insert(
                 calendarId='primary', 
                 body=event_data
             ).execute()
@@ -155,7 +202,7 @@ class CalendarClient(BaseServiceClient):
         """
         try:
             # Update event
-            updated_event = self._service.events().update(
+            updated_event = self._collection('events').update(
                 calendarId='primary', 
                 eventId=event_id, 
                 body=update_data
@@ -177,10 +224,7 @@ class CalendarClient(BaseServiceClient):
             True if deletion was successful
         """
         try:
-            self._service.events().delete(
-                calendarId='primary', 
-                eventId=event_id
-            ).execute()
+            self._delete_request(event_id).execute()
             
             return True
         
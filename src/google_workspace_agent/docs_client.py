@@ -5,14 +5,20 @@ Provides methods for interacting with Google Docs API, including
 document management and manipulation operations.
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
-import os
+import functools
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from .service_client import BaseServiceClient
 
+# Number of documents whose length is remembered; the least recently used
+# ones are forgotten first
+DOCUMENT_LENGTH_CACHE_SIZE = 256
+
 class DocsClient(BaseServiceClient):
     """
     Client for interacting with Google Docs API.
@@ -20,45 +26,81 @@ class DocsClient(BaseServiceClient):
     Provides methods for document-related operations.
     """
     
-    def __init__(self, credentials: Credentials):
+    # Drive query selecting Google Docs documents
+    LIST_QUERY = "mimeType='application/vnd.google-apps.document'"
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 http: Optional[Any] = None):
         """
         Initialize Docs service client.
         
         Args:
             credentials: Google OAuth 2.0 credentials
+            http: Optional authorized transport shared with other clients
         """
         super().__init__(
             credentials=credentials, 
             service_name='docs',
-            service_version='v1'
+            service_version='v1',
+            http=http
         )
+        
+        # End index of each document body this client has seen, kept up to
+        # date locally so appends don't need to fetch the document first
+        self._document_lengths: 'OrderedDict[str, int]' = OrderedDict()
+    
+    @functools.cached_property
+    def _drive_service(self) -> Any:
+        """
+        Drive service used for listing and deleting documents, built on first use.
+        
+        Returns:
+            Drive v3 service resource
+        """
+        return self._build_service('drive', 'v3')
     
     def list_items(self, 
-                   max_results: Optional[int] = 10) -> List[Dict[str, Any]]:
+                   max_results: Optional[int] = 10,
+                   fields: str = 'files(id,name,modifiedTime,mimeType),nextPageToken',
+                   max_pages: Optional[int] = 1) -> List[Dict[str, Any]]:
         """
         List documents in the user's Google Drive.
         
         Args:
             max_results: Maximum number of documents to return
+            fields: Partial response mask selecting the fields to return
+            max_pages: Maximum number of result pages to fetch, each of up
+                to max_results items (None for all pages)
         
         Returns:
             List of document metadata
         """
         try:
-            # Create a separate Drive service
-            from googleapiclient.discovery import build
-            drive_service = build('drive', 'v3', credentials=self._credentials)
-            
-            results = drive_service.files().list(
+            files = self._drive_service.files()
+            request = files.list(
                 pageSize=max_results,
-                q="mimeType='application/vnd.google-apps.document'"
-            ).execute()
+                q=self.LIST_QUERY,
+                fields=fields
+            )
             
-            return results.get('files', [])
+            return list(self._paginate(files, request, 'files', max_pages))
         
         except HttpError as error:
             self.handle_api_error(error)
     
+    def _get_request(self, document_id: str) -> HttpRequest:
+        """
+        Build the request that retrieves a specific document.
+        
+        Args:
+            document_id: Unique identifier for the document
+        
+        Returns:
+            Unexecuted documents.get request
+        """
+        return self._collection('documents').get(documentId=document_id)
+    
     def get_item(self, document_id: str) -> Dict[str, Any]:
         """
         Retrieve a specific document metadata.
@@ -70,9 +112,10 @@ class DocsClient(BaseServiceClient):
             Detailed document information
         """
         try:
-            document = self._service.documents().get(
-                documentId=document_id
-            ).execute()
+            document = self._single_flight(
+                ('get', document_id), 
+                lambda: self._get_request(document_id).execute()
+            )
             
             return document
         
@@ -99,28 +142,25 @@ class DocsClient(BaseServiceClient):
             }
             
             # Create document
-            document = self._service.documents().create(
+            document = self._collection('documents').create(
                 body=document_body
             ).execute()
+            self._remember_length(document['documentId'], self._body_end_index(document))
             
-            # Add initial content if provided
+            # Add initial content if provided, as a single insertion so the
+            # items keep their order and the request stays small
             if content:
-                requests = []
-                for item in content:
-                    requests.append({
-                        'insertText': {
-                            'location': {
-                                'index': 1
-                            },
-                            'text': item.get('text', '')
-                        }
-                    })
+                requests = [{
+                    'insertText': {
+                        'location': {
+                            'index': 1
+                        },
+                        'text': ''.join(item.get('text', '') for item in content)
+                    }
+                }]
                 
                 # Batch update document with content
-                self._service.documents().batchUpdate(
-                    documentId=document['documentId'],
-                    body={'requests': requests}
-                ).execute()
+                self._batch_update(document['documentId'], requests)
             
             return document
         
@@ -141,18 +181,8 @@ class DocsClient(BaseServiceClient):
             Updated document metadata
         """
         try:
-            # Prepare batch update request
-            batch_update_request = {
-                'requests': updates
-            }
-            
             # Execute batch update
-            response = self._service.documents().batchUpdate(
-                documentId=document_id,
-                body=batch_update_request
-            ).execute()
-            
-            return response
+            return self._batch_update(document_id, updates)
         
         except HttpError as error:
             self.handle_api_error(error)
@@ -169,8 +199,7 @@ class DocsClient(BaseServiceClient):
         """
         try:
             # Use Drive API to delete document
-            drive_service = self._service.service_resources['drive']
-            drive_service.files().delete(fileId=document_id).execute()
+            self._drive_service.files().delete(fileId=document_id).execute()
             
             return True
         
@@ -204,29 +233,121 @@ class DocsClient(BaseServiceClient):
             }
             
             # Execute text insertion
-            response = self._service.documents().batchUpdate(
-                documentId=document_id,
-                body={'requests': [request]}
-            ).execute()
-            
-            return response
+            return self._batch_update(document_id, [request])
         
         except HttpError as error:
             self.handle_api_error(error)
     
+    def _batch_update(self, 
+                      document_id: str, 
+                      requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply update requests to a document and track its new length.
+        
+        Args:
+            document_id: Unique identifier for the document
+            requests: List of update requests
+        
+        Returns:
+            Batch update response
+        """
+        try:
+            response = self._collection('documents').batchUpdate(
+                documentId=document_id,
+                body={'requests': requests}
+            ).execute()
+        except HttpError:
+            # The document may have changed underneath us
+            self._document_lengths.pop(document_id, None)
+            raise
+        
+        self._track_length(document_id, requests)
+        return response
+    
+    def _track_length(self, 
+                      document_id: str, 
+                      requests: List[Dict[str, Any]]) -> None:
+        """
+        Update the cached length of a document after applying requests.
+        
+        Only text insertions and deletions are tracked; any other request
+        drops the cached length so it is fetched again when needed.
+        
+        Args:
+            document_id: Unique identifier for the document
+            requests: Update requests that were applied
+        """
+        length = self._document_lengths.get(document_id)
+        if length is None:
+            return
+        
+        for request in requests:
+            if 'insertText' in request:
+                # Indexes count UTF-16 code units
+                length += len(request['insertText']['text'].encode('utf-16-le')) // 2
+            elif 'deleteContentRange' in request:
+                deleted = request['deleteContentRange']['range']
+                length -= deleted['endIndex'] - deleted['startIndex']
+            elif 'updateTextStyle' not in request and 'updateParagraphStyle' not in request:
+                self._document_lengths.pop(document_id, None)
+                return
+        
+        self._remember_length(document_id, length)
+    
+    def _remember_length(self, document_id: str, length: int) -> None:
+        """
+        Cache the length of a document, evicting the least recently used.
+        
+        Args:
+            document_id: Unique identifier for the document
+            length: End index of the document body
+        """
+        self._document_lengths[document_id] = length
+        self._document_lengths.move_to_end(document_id)
+        if len(self._document_lengths) > DOCUMENT_LENGTH_CACHE_SIZE:
+            self._document_lengths.popitem(last=False)
+    
+    @staticmethod
+    def _body_end_index(document: Dict[str, Any]) -> int:
+        """
+        Get the end index of a document's body.
+        
+        Args:
+            document: Document resource, or a partial response with
+                ``body/content/endIndex``
+        
+        Returns:
+            End index of the last structural element in the body
+        """
+        content = document.get('body', {}).get('content', [])
+        return content[-1].get('endIndex', 1) if content else 1
+    
     def _get_document_length(self, document_id: str) -> int:
         """
         Get the total length of a document.
         
+        Uses the locally tracked length when available; otherwise only the
+        end indexes of the body are fetched.
+        
         Args:
             document_id: Unique identifier for the document
         
         Returns:
             Total number of characters in the document
         """
+        if document_id in self._document_lengths:
+            self._document_lengths.move_to_end(document_id)
+            return self._document_lengths[document_id]
+        
         try:
-            document = self.get_item(document_id)
-            return document.get('body', {}).get('content', [])[-1].get('endIndex', 1)
+            document = self._collection('documents').get(
+                documentId=document_id,
+                fields='body/content/endIndex'
+            ).execute()
         
         except Exception:
             return 1
+        
+        length = self._body_end_index(document)
+        self._remember_length(document_id, length)
+        return length
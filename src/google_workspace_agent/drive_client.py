@@ -5,15 +5,32 @@ Provides methods for interacting with Google Drive API, including
 file and folder management operations.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
 import io
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+import os
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload, MediaFileUpload
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
 
 from .service_client import BaseServiceClient
 
+# Bytes fetched per download request; the library default (100KB) turns
+# large downloads into thousands of round trips
+DOWNLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Files at least this large are downloaded with parallel range requests,
+# RANGE_CHUNK_SIZE bytes per request over RANGE_WORKERS connections
+PARALLEL_DOWNLOAD_THRESHOLD = 100 * 1024 * 1024
+RANGE_CHUNK_SIZE = 16 * 1024 * 1024
+RANGE_WORKERS = 8
+
+# Files below this size are sent in a single simple upload request; larger
+# ones use resumable uploads of UPLOAD_CHUNK_SIZE bytes per request
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
 class DriveClient(BaseServiceClient):
     """
     Client for interacting with Google Drive API.
@@ -21,23 +38,32 @@ class DriveClient(BaseServiceClient):
     Provides methods for file and folder-related operations.
     """
     
-    def __init__(self, credentials: Credentials):
+    # Drive allows 12,000 requests per minute per user
+    MAX_QPS = 200
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 http: Optional[Any] = None):
         """
         Initialize Drive service client.
         
         Args:
             credentials: Google OAuth 2.0 credentials
+            http: Optional authorized transport shared with other clients
         """
         super().__init__(
             credentials=credentials, 
             service_name='drive',
-            service_version='v3'
+            service_version='v3',
+            http=http
         )
     
     def list_items(self, 
                    max_results: Optional[int] = 10, 
                    query: Optional[str] = None,
-                   order_by: Optional[str] = 'modifiedTime desc') -> List[Dict[str, Any]]:
+                   order_by: Optional[str] = 'modifiedTime desc',
+                   fields: str = 'files(id, name, mimeType, modifiedTime, owners, size), nextPageToken',
+                   max_pages: Optional[int] = 1) -> List[Dict[str, Any]]:
         """
         List files and folders in Google Drive.
         
@@ -45,6 +71,9 @@ class DriveClient(BaseServiceClient):
             max_results: Maximum number of items to return
             query: Optional search query to filter files
             order_by: Optional sorting parameter
+            fields: Partial response mask selecting the fields to return
+            max_pages: Maximum number of result pages to fetch, each of up
+                to max_results items (None for all pages)
         
         Returns:
             List of files and folders
@@ -54,22 +83,52 @@ class DriveClient(BaseServiceClient):
             list_params = {
                 'pageSize': max_results,
                 'orderBy': order_by,
-                'fields': 'files(id, name, mimeType, modifiedTime, owners, size)'
+                'fields': fields
             }
             
             # Add optional query
             if query:
                 list_params['q'] = query
             
-            # Execute list request
-            results = self._service.files().list(**list_params).execute()
-            
-            # Extract and return files
-            return results.get('files', [])
+            # Execute list request, following next pages as needed
+            files = self._collection('files')
+            return list(self._paginate(
+                files, 
+                files.list(**list_params), 
+                'files', 
+                max_pages
+            ))
         
         except HttpError as error:
             self.handle_api_error(error)
     
+    def _get_request(self, file_id: str) -> HttpRequest:
+        """
+        Build the request that retrieves file or folder metadata.
+        
+        Args:
+            file_id: Unique identifier for the file or folder
+        
+        Returns:
+            Unexecuted files.get request
+        """
+        return self._collection('files').get(
+            fileId=file_id,
+            fields='id, name, mimeType, modifiedTime, owners, size, webViewLink'
+        )
+    
+    def _delete_request(self, file_id: str) -> HttpRequest:
+        """
+        Build the request that deletes file or folder metadata.
+        
+        Args:
+            file_id: Unique identifier for the file or folder
+        
+        Returns:
+            Unexecuted files.delete request
+        """
+        return self._collection('files').delete(fileId=file_id)
+    
     def get_item(self, file_id: str) -> Dict[str, Any]:
         """
         Retrieve a specific file or folder metadata.
@@ -81,10 +140,10 @@ class DriveClient(BaseServiceClient):
             Detailed file or folder information
         """
         try:
-            file_metadata = self._service.files().get(
-                fileId=file_id,
-                fields='id, name, mimeType, modifiedTime, owners, size, webViewLink'
-            ).execute()
+            file_metadata = self._single_flight(
+                ('get', file_id), 
+                lambda: self._get_request(file_id).execute()
+            )
             
             return file_metadata
         
@@ -118,7 +177,7 @@ class DriveClient(BaseServiceClient):
                 file_metadata['parents'] = [parent_id]
             
             # Create file or folder
-            created_file = self._service.files().create(
+            created_file = self._collection('files').create(
                 body=file_metadata,
                 fields='id, name, mimeType, webViewLink'
             ).execute()
@@ -143,7 +202,7 @@ class DriveClient(BaseServiceClient):
         """
         try:
             # Update file metadata
-            updated_file = self._service.files().update(
+            updated_file = self._collection('files').update(
                 fileId=file_id,
                 body=update_data,
                 fields='id, name, mimeType'
@@ -165,7 +224,7 @@ class DriveClient(BaseServiceClient):
             True if deletion was successful
         """
         try:
-            self._service.files().delete(fileId=file_id).execute()
+            self._delete_request(file_id).execute()
             return True
         
         except HttpError as error:
@@ -186,29 +245,118 @@ class DriveClient(BaseServiceClient):
         """
         try:
             # Request file download
-            request = self._service.files().get_media(fileId=file_id)
+            request = self._collection('files').get_media(fileId=file_id)
+            size = self._get_download_size(file_id)
+            parallel = size is not None and size >= PARALLEL_DOWNLOAD_THRESHOLD
             
             # Prepare download destination
             if local_path:
-                # Download to local file
-                with open(local_path, 'wb') as file:
-                    downloader = MediaIoBaseDownload(file, request)
-                    done = False
-                    while not done:
-                        _, done = downloader.next_chunk()
+                if parallel and hasattr(os, 'pwrite'):
+                    # Fetch ranges of large files concurrently, writing each
+                    # at its offset in a preallocated file
+                    fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                    try:
+                        os.truncate(fd, size)
+                        self._download_ranges(
+                            request.uri, 
+                            size, 
+                            lambda content, start: os.pwrite(fd, content, start)
+                        )
+                    finally:
+                        os.close(fd)
+                else:
+                    # Download to local file, unbuffered since every write
+                    # is a full chunk
+                    with open(local_path, 'wb', buffering=0) as file:
+                        self._download(file, request)
                 return None
+            elif parallel:
+                # Fetch ranges of large files concurrently into one buffer
+                buffer = bytearray(size)
+                with memoryview(buffer) as view:
+                    def write_range(content: bytes, start: int) -> None:
+                        view[start:start + len(content)] = content
+                    
+                    self._download_ranges(request.uri, size, write_range)
+                return bytes(buffer)
             else:
                 # Return file content as bytes
                 file_content = io.BytesIO()
-                downloader = MediaIoBaseDownload(file_content, request)
-                done = False
-                while not done:
-                    _, done = downloader.next_chunk()
+                self._download(file_content, request)
+                # getvalue() hands back the internal buffer without copying
+                # it while no views of the buffer are held
                 return file_content.getvalue()
         
         except HttpError as error:
             self.handle_api_error(error)
     
+    def _download(self, file: io.IOBase, request: HttpRequest) -> None:
+        """
+        Stream a media request into a file object in large chunks.
+        
+        Args:
+            file: Writable destination for the downloaded content
+            request: Media download request
+        """
+        downloader = MediaIoBaseDownload(
+            file, 
+            request, 
+            chunksize=DOWNLOAD_CHUNK_SIZE
+        )
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+    
+    def _get_download_size(self, file_id: str) -> Optional[int]:
+        """
+        Look up the size of a file's binary content.
+        
+        Args:
+            file_id: Unique identifier for the file
+        
+        Returns:
+            Size in bytes, or None for files without binary content
+            (such as Google Docs)
+        """
+        metadata = self._collection('files').get(
+            fileId=file_id,
+            fields='size'
+        ).execute()
+        size = metadata.get('size')
+        return int(size) if size is not None else None
+    
+    def _download_ranges(self, 
+                         uri: str, 
+                         size: int, 
+                         write: Callable[[bytes, int], Any]) -> None:
+        """
+        Download a file with concurrent HTTP range requests.
+        
+        Ranges can complete in any order, so each is handed to ``write``
+        together with its offset in the file.
+        
+        Args:
+            uri: Media download URI for the file
+            size: Size of the file in bytes
+            write: Callable storing a range's content at the given offset
+        """
+        def download_range(start: int) -> None:
+            end = min(start + RANGE_CHUNK_SIZE, size) - 1
+            resp, content = self._http.request(
+                uri, 
+                headers={'Range': f'bytes={start}-{end}'}
+            )
+            if resp.status >= 300:
+                raise HttpError(resp, content, uri=uri)
+            write(content, start)
+        
+        with ThreadPoolExecutor(max_workers=RANGE_WORKERS) as executor:
+            # list() re-raises the first failed range, if any
+            list(executor.map(
+                download_range, 
+                range(0, size, RANGE_CHUNK_SIZE)
+            ))
+    
     def upload_file(self, 
                     local_path: str, 
                     name: Optional[str] = None,
@@ -236,15 +384,17 @@ class DriveClient(BaseServiceClient):
             if parent_id:
                 file_metadata['parents'] = [parent_id]
             
-            # Prepare media upload
+            # Prepare media upload, skipping the resumable session setup
+            # round trip for small files
             media = MediaFileUpload(
                 local_path, 
-                resumable=True, 
-                mimetype=mime_type
+                resumable=os.path.getsize(local_path) >= SIMPLE_UPLOAD_LIMIT, 
+                mimetype=mime_type,
+                chunksize=UPLOAD_CHUNK_SIZE
             )
             
             # Upload file
-            uploaded_file = self._service.files().create(
+            uploaded_file = self._collection('files').create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, name, mimeType, webViewLink'
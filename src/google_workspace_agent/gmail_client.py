@@ -7,13 +7,21 @@ reading, sending, and managing emails.
 
 from typing import List, Dict, Any, Optional
 import base64
-from email.mime.text import MIMEText
+import io
+from email.message import EmailMessage
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, MediaIoBaseUpload
 
 from .service_client import BaseServiceClient
 
+# Messages at least this large are sent as a media upload of their RFC 822
+# bytes, skipping the base64url copy (a third larger) that the JSON 'raw'
+# field needs; above RESUMABLE_SEND_THRESHOLD the upload is resumable
+MEDIA_SEND_THRESHOLD = 1024 * 1024
+RESUMABLE_SEND_THRESHOLD = 5 * 1024 * 1024
+
 class GmailClient(BaseServiceClient):
     """
     Client for interacting with Gmail API.
@@ -21,23 +29,35 @@ class GmailClient(BaseServiceClient):
     Provides methods for email-related operations.
     """
     
-    def __init__(self, credentials: Credentials):
+    # Gmail accepts at most 100 sub-requests per batch request
+    MAX_BATCH_SIZE = 100
+    
+    # Stay below Gmail's per-user quota of 250 units/s (5 units per get)
+    MAX_QPS = 25
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 http: Optional[Any] = None):
         """
         Initialize Gmail service client.
         
         Args:
             credentials: Google OAuth 2.0 credentials
+            http: Optional authorized transport shared with other clients
         """
         super().__init__(
             credentials=credentials, 
             service_name='gmail',
-            service_version='v1'
+            service_version='v1',
+            http=http
         )
     
     def list_items(self, 
                    max_results: Optional[int] = 10, 
                    label_ids: Optional[List[str]] = None,
-                   query: Optional[str] = None) -> List[Dict[str, Any]]:
+                   query: Optional[str] = None,
+                   fields: str = 'messages(id,threadId),nextPageToken',
+                   max_pages: Optional[int] = 1) -> List[Dict[str, Any]]:
         """
         List emails in the user's mailbox.
         
@@ -45,13 +65,16 @@ class GmailClient(BaseServiceClient):
             max_results: Maximum number of emails to return
             label_ids: List of label IDs to filter emails
             query: Search query to filter emails
+            fields: Partial response mask selecting the fields to return
+            max_pages: Maximum number of result pages to fetch, each of up
+                to max_results items (None for all pages)
         
         Returns:
             List of email metadata
         """
         try:
             # Prepare request parameters
-            list_params = {'userId': 'me', 'maxResults': max_results}
+            list_params = {'userId': 'me', 'maxResults': max_results, 'fields': fields}
             
             if label_ids:
                 list_params['labelIds'] = label_ids
@@ -59,31 +82,81 @@ class GmailClient(BaseServiceClient):
             if query:
                 list_params['q'] = query
             
-            # Execute list request
-            results = self._service.users().messages().list(**list_params).execute()
-            
-            # Extract and return email metadata
-            return results.get('messages', [])
+            # Execute list request, following next pages as needed
+            messages = self._collection('users', 'messages')
+            return list(self._paginate(
+                messages, 
+                messages.list(**list_params), 
+                'messages', 
+                max_pages
+            ))
         
         except HttpError as error:
             self.handle_api_error(error)
     
-    def get_item(self, message_id: str) -> Dict[str, Any]:
+    def _get_request(self, 
+                     message_id: str, 
+                     message_format: str = 'full',
+                     metadata_headers: Optional[List[str]] = None) -> HttpRequest:
+        """
+        Build the request that retrieves a specific email.
+        
+        Args:
+            message_id: Unique identifier for the email
+            message_format: Gmail message format ('full', 'metadata', ...)
+            metadata_headers: Headers to include with the 'metadata' format
+        
+        Returns:
+            Unexecuted messages.get request
+        """
+        get_params = {'userId': 'me', 'id': message_id, 'format': message_format}
+        
+        if metadata_headers:
+            get_params['metadataHeaders'] = metadata_headers
+        
+        return self._collection('users', 'messages').get(**get_params)
+    
+    def _delete_request(self, message_id: str) -> HttpRequest:
+        """
+        Build the request that deletes a specific email.
+        
+        Args:
+            message_id: Unique identifier for the email
+        
+        Returns:
+            Unexecuted messages.delete request
+        """
+        return self._collection('users', 'messages').delete(
+            userId='me', 
+            id=message_id
+        )
+    
+    def get_item(self, 
+                 message_id: str, 
+                 message_format: str = 'full',
+                 metadata_headers: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Retrieve a specific email by ID.
         
         Args:
             message_id: Unique identifier for the email
+            message_format: Gmail message format; use 'metadata' with
+                metadata_headers (e.g. ['From', 'Subject', 'Date']) when
+                only headers are needed
+            metadata_headers: Headers to include with the 'metadata' format
         
         Returns:
             Detailed email information
         """
         try:
-            message = self._service.users().messages().get(
-                userId='me', 
-                id=message_id, 
-                format='full'
-            ).execute()
+            message = self._single_flight(
+                ('get', message_id, message_format, tuple(metadata_headers or ())), 
+                lambda: self._get_request(
+                    message_id, 
+                    message_format=message_format, 
+                    metadata_headers=metadata_headers
+                ).execute()
+            )
             
             return message
         
@@ -109,22 +182,33 @@ class GmailClient(BaseServiceClient):
         """
         try:
             # Create email message
-            message = MIMEText(body, 'plain')
-            message['to'] = to
-            message['subject'] = subject
+            message = EmailMessage()
+            message['To'] = to
+            message['Subject'] = subject
+            message.set_content(body)
             
-            # Add HTML body if provided
+            # Add HTML body if provided, as a multipart/alternative part
             if html_body:
-                message.attach(MIMEText(html_body, 'html'))
+                message.add_alternative(html_body, subtype='html')
             
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+            # Serialize message
+            message_bytes = bytes(message)
+            messages = self._collection('users', 'messages')
             
             # Send email
-            sent_message = self._service.users().messages().send(
-                userId='me', 
-                body={'raw': raw_message}
-            ).execute()
+            if len(message_bytes) >= MEDIA_SEND_THRESHOLD:
+                media = MediaIoBaseUpload(
+                    io.BytesIO(message_bytes), 
+                    mimetype='message/rfc822', 
+                    resumable=len(message_bytes) > RESUMABLE_SEND_THRESHOLD
+                )
+                sent_message = messages.send(userId='me', media_body=media).execute()
+            else:
+                raw_message = base64.urlsafe_b64encode(message_bytes).decode('ascii')
+                sent_message = messages.send(
+                    userId='me', 
+                    body={'raw': raw_message}
+                ).execute()
             
             return sent_message
         
@@ -161,7 +245,7 @@ class GmailClient(BaseServiceClient):
                 modify_request['body']['removeLabelIds'] = remove_labels
             
             # Execute label modification
-            updated_message = self._service.users().messages().modify(
+            updated_message = self._collection('users', 'messages').modify(
                 **modify_request
             ).execute()
             
@@ -181,10 +265,7 @@ class GmailClient(BaseServiceClient):
             True if deletion was successful
         """
         try:
-            self._service.users().messages().delete(
-                userId='me', 
-                id=message_id
-            ).execute()
+            self._delete_request(message_id).execute()
             
             return True
         
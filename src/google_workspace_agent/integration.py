@@ -5,9 +5,14 @@ Provides coordination and workflow management across different
 Google Workspace service clients using Groq LLM.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
 import logging
-import json
+import re
+
+import orjson
 
 from .auth import GoogleWorkspaceAuth
 from .llm_client import GroqLLMClient
@@ -16,6 +21,63 @@ from .calendar_client import CalendarClient
 from .drive_client import DriveClient
 from .sheets_client import SheetsClient
 from .docs_client import DocsClient
+from .service_client import create_authorized_http
+
+# Number of distinct requests whose extracted intent is remembered
+INTENT_CACHE_SIZE = 128
+
+# Groq structured output mode guaranteeing a parseable JSON object
+JSON_RESPONSE_FORMAT = {'type': 'json_object'}
+
+# Threads running the sub-requests of multi-service requests concurrently
+MULTI_SERVICE_WORKERS = 8
+
+# Simple commands whose service, action and parameters can be read straight
+# from the request, so they don't need an LLM call. Patterns must match the
+# whole request; anything more elaborate goes to the LLM.
+FAST_INTENT_PATTERNS = [
+    (re.compile(r"(?:list|show)(?: me)? my (?:recent |latest )?(?:emails|messages|inbox)", re.I), 
+     'email', 'read'),
+    (re.compile(r"(?:list|show)(?: me)? my (?:upcoming )?(?:calendar )?(?:events|meetings)", re.I), 
+     'calendar', 'list'),
+    (re.compile(r"(?:list|show)(?: me)? my (?:recent |latest )?(?:drive )?files", re.I), 
+     'drive', 'list'),
+    (re.compile(r"create a (?:new )?(?:google )?docs? document titled '(?P<title>[^']+)'", re.I), 
+     'docs', 'create'),
+    (re.compile(r"create a (?:new )?(?:google )?(?:sheets )?spreadsheet titled '(?P<title>[^']+)'", re.I), 
+     'sheets', 'create')
+]
+
+# Instructions for extracting the intent of a request
+INTENT_SYSTEM_PROMPT = """
+You are an intent extraction assistant for a Google Workspace agent.
+Extract the following from a user request:
+- Target service (email, calendar, drive, sheets, docs, or multi)
+- Specific action (create, read, update, delete, etc.)
+- Relevant parameters
+
+Return a JSON with these details. For multi, also include an
+"actions" object keyed by service, where each value has an "action"
+and a "details" object.
+"""
+
+# Instructions for breaking a multi-service request into per-service
+# intents; they live in the system message so every call shares the same
+# prompt prefix and only the request details vary
+DECOMPOSITION_SYSTEM_PROMPT = """
+You are a workflow decomposition assistant.
+Break down the user's multi-service request into specific actions.
+
+Return only a JSON object keyed by service (email, calendar, drive,
+sheets or docs), where each value has an "action" and a "details"
+object with that action's parameters.
+"""
+
+# Instructions for extracting the intents of several requests in one call
+BATCH_INTENT_SYSTEM_PROMPT = INTENT_SYSTEM_PROMPT + """
+The user message is a JSON array of requests. Return a JSON object with an
+"intents" array holding one intent per request, in the same order.
+"""
 
 class WorkspaceIntegration:
     """
@@ -35,19 +97,84 @@ class WorkspaceIntegration:
         """
         self._credentials = credentials
         
-        # Initialize service clients
-        self.gmail_client = GmailClient(credentials.get_credentials())
-        self.calendar_client = CalendarClient(credentials.get_credentials())
-        self.drive_client = DriveClient(credentials.get_credentials())
-        self.sheets_client = SheetsClient(credentials.get_credentials())
-        self.docs_client = DocsClient(credentials.get_credentials())
+        # Service clients are built on first use, on one shared transport,
+        # so they reuse the same kept-alive connections to googleapis.com
+        self._google_credentials = credentials.get_credentials()
+        self._http = create_authorized_http(self._google_credentials)
         
         # Initialize LLM client
         self.llm_client = llm_client or GroqLLMClient()
         
+        # Remember extracted intents, so repeated requests don't go back to
+        # the LLM
+        self._cached_intent = functools.lru_cache(maxsize=INTENT_CACHE_SIZE)(
+            self._request_intent
+        )
+        
+        # Dispatch tables from service and action names to their handlers
+        self._dispatch = {
+            'email': self._handle_email_request,
+            'calendar': self._handle_calendar_request,
+            'drive': self._handle_drive_request,
+            'sheets': self._handle_sheets_request,
+            'docs': self._handle_docs_request,
+            'multi': self._handle_multi_service_request
+        }
+        self._actions = {
+            'email': {'send': self._send_email, 'read': self._read_emails},
+            'calendar': {'create': self._create_event, 'list': self._list_events},
+            'drive': {'upload': self._upload_file, 'list': self._list_files},
+            'sheets': {'create': self._create_spreadsheet, 'read': self._read_values},
+            'docs': {'create': self._create_document, 'append': self._append_text}
+        }
+        
+        # Shared pool for the independent sub-requests of multi-service requests
+        self._executor = ThreadPoolExecutor(max_workers=MULTI_SERVICE_WORKERS)
+        
         # Configure logging
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    @functools.cached_property
+    def gmail_client(self) -> GmailClient:
+        """Gmail client, built on first use."""
+        return GmailClient(self._google_credentials, http=self._http)
+    
+    @functools.cached_property
+    def calendar_client(self) -> CalendarClient:
+        """Calendar client, built on first use."""
+        return CalendarClient(self._google_credentials, http=self._http)
+    
+    @functools.cached_property
+    def drive_client(self) -> DriveClient:
+        """Drive client, built on first use."""
+        return DriveClient(self._google_credentials, http=self._http)
+    
+    @functools.cached_property
+    def sheets_client(self) -> SheetsClient:
+        """Sheets client, built on first use."""
+        return SheetsClient(self._google_credentials, http=self._http)
+    
+    @functools.cached_property
+    def docs_client(self) -> DocsClient:
+        """Docs client, built on first use."""
+        return DocsClient(self._google_credentials, http=self._http)
+    
+    def close(self) -> None:
+        """
+        Release the worker threads of the multi-service request pool.
+        
+        Requests already running are left to finish in the background.
+        """
+        self._executor.shutdown(wait=False)
+    
+    def __enter__(self) -> 'WorkspaceIntegration':
+        """Use the integration as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the integration."""
+        self.close()
+    
     def process_natural_language_request(self, request: str) -> Dict[str, Any]:
         """
         Process a natural language request across multiple services.
@@ -62,24 +189,7 @@ class WorkspaceIntegration:
             # Use LLM to interpret the request
             intent = self._extract_intent(request)
             
-            # Route request to appropriate service(s)
-            if intent['service'] == 'email':
-                return self._handle_email_request(intent)
-            elif intent['service'] == 'calendar':
-                return self._handle_calendar_request(intent)
-            elif intent['service'] == 'drive':
-                return self._handle_drive_request(intent)
-            elif intent['service'] == 'sheets':
-                return self._handle_sheets_request(intent)
-            elif intent['service'] == 'docs':
-                return self._handle_docs_request(intent)
-            elif intent['service'] == 'multi':
-                return self._handle_multi_service_request(intent)
-            else:
-                return {
-                    'status': 'error',
-                    'message': f"Unsupported service: {intent['service']}"
-                }
+            return self._process_intent(intent)
         
         except Exception as e:
             self.logger.error(f"Error processing request: {e}")
@@ -88,6 +198,127 @@ class WorkspaceIntegration:
                 'message': str(e)
             }
     
+    def batch_process_requests(self, requests: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several natural language requests together.
+        
+        The intents of all requests are extracted with a single LLM call,
+        then the requests are dispatched concurrently. A failing request
+        doesn't affect the others.
+        
+        Args:
+            requests: Natural language requests
+        
+        Returns:
+            Processed request results, in the order of the requests
+        """
+        intents = self._extract_intents(requests)
+        results = [None] * len(requests)
+        
+        # A dedicated pool, so multi-service requests in the batch can still
+        # hand their sub-requests to the shared executor
+        with ThreadPoolExecutor(max_workers=min(MULTI_SERVICE_WORKERS, len(requests) or 1)) as executor:
+            futures = {}
+            for position, intent in enumerate(intents):
+                if isinstance(intent, Exception):
+                    results[position] = intent
+                else:
+                    futures[position] = executor.submit(self._process_intent, intent)
+            
+            for position, future in futures.items():
+                try:
+                    results[position] = future.result()
+                except Exception as e:
+                    results[position] = e
+        
+        for position, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing request: {result}")
+                results[position] = {
+                    'status': 'error',
+                    'message': str(result)
+                }
+        
+        return results
+    
+    def _extract_intents(self, requests: List[str]) -> List[Any]:
+        """
+        Extract the intents of several requests with at most one LLM call.
+        
+        Args:
+            requests: Natural language requests
+        
+        Returns:
+            Intent for each request, or the exception raised extracting it
+        """
+        intents = [self._match_fast_intent(request) for request in requests]
+        pending = list(dict.fromkeys(
+            request for request, intent in zip(requests, intents) if intent is None
+        ))
+        
+        extracted = {}
+        if len(pending) == 1:
+            # A single request takes the cached single-intent path
+            try:
+                extracted[pending[0]] = self._extract_intent(pending[0])
+            except Exception as e:
+                extracted[pending[0]] = e
+        elif pending:
+            try:
+                response = self.llm_client.generate_response(
+                    prompt=orjson.dumps(pending).decode(), 
+                    system_message=BATCH_INTENT_SYSTEM_PROMPT,
+                    response_format=JSON_RESPONSE_FORMAT,
+                    use_context=False
+                )
+                batch_intents = orjson.loads(response).get('intents')
+                if not isinstance(batch_intents, list) or len(batch_intents) != len(pending):
+                    raise ValueError("Intent count doesn't match the requests")
+                extracted.update(zip(pending, batch_intents))
+            except Exception as e:
+                self.logger.error(f"Could not extract intents for batch: {e}")
+                extracted.update((request, e) for request in pending)
+        
+        return [
+            intent if intent is not None else extracted[request]
+            for request, intent in zip(requests, intents)
+        ]
+    
+    def _process_intent(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Route an already structured intent to its service handler.
+        
+        Args:
+            intent: Extracted intent with service, action and details
+        
+        Returns:
+            Processed request result with action details
+        """
+        handler = self._dispatch.get(intent['service'])
+        if handler is None:
+            return {
+                'status': 'error',
+                'message': f"Unsupported service: {intent['service']}"
+            }
+        
+        return handler(intent)
+    
+    async def aprocess_natural_language_request(self, request: str) -> Dict[str, Any]:
+        """
+        Process a natural language request without blocking the event loop.
+        
+        The Google API and LLM calls are blocking, so the request is run in
+        a worker thread. Independent requests can then be awaited together
+        with ``asyncio.gather``.
+        
+        Args:
+            request: Natural language request from the user
+        
+        Returns:
+            Processed request result with action details
+        """
+        return await asyncio.to_thread(self.process_natural_language_request, request)
+    
     def _extract_intent(self, request: str) -> Dict[str, Any]:
         """
         Use LLM to extract intent and parameters from request.
@@ -98,30 +329,97 @@ class WorkspaceIntegration:
         Returns:
             Structured intent with service and action details
         """
-        system_prompt = """
-        You are an intent extraction assistant for a Google Workspace agent.
-        Extract the following from a user request:
-        - Target service (email, calendar, drive, sheets, docs, or multi)
-        - Specific action (create, read, update, delete, etc.)
-        - Relevant parameters
+        # Simple commands are classified without asking the LLM
+        intent = self._match_fast_intent(request)
+        if intent is not None:
+            return intent
+        
+        # Surrounding whitespace (such as the newline of a line read from a
+        # terminal) doesn't get its own cache entry
+        return self._cached_intent(request.strip(), INTENT_SYSTEM_PROMPT)
+    
+    @staticmethod
+    def _match_fast_intent(request: str) -> Optional[Dict[str, Any]]:
+        """
+        Classify a simple command with the fast intent patterns.
+        
+        Args:
+            request: Natural language request
+        
+        Returns:
+            Structured intent, or None if no pattern matches the whole request
+        """
+        command = request.strip().rstrip('.!')
+        for pattern, service, action in FAST_INTENT_PATTERNS:
+            match = pattern.fullmatch(command)
+            if match:
+                return {
+                    'service': service,
+                    'action': action,
+                    'details': match.groupdict()
+                }
         
-        Return a JSON with these details.
+        return None
+    
+    def _request_intent(self, request: str, system_prompt: str) -> Dict[str, Any]:
         """
+        Ask the LLM for the intent of a request.
+        
+        Args:
+            request: Natural language request
+            system_prompt: Intent extraction instructions
         
+        Returns:
+            Structured intent parsed from the LLM response
+        
+        Raises:
+            ValueError: If the response isn't valid JSON; the failure is not
+                cached, so the next attempt asks the LLM again
+        """
+        # JSON mode isn't supported with streaming, and its response ends
+        # with the object anyway, so the intent is read in one piece
         response = self.llm_client.generate_response(
             prompt=request, 
-            system_message=system_prompt
+            system_message=system_prompt,
+            response_format=JSON_RESPONSE_FORMAT,
+            use_context=False
         )
         
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # Fallback to default intent if parsing fails
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Could not parse intent for request: {e}")
+            raise ValueError(f"Could not parse intent: {e}") from e
+    
+    def clear_intent_cache(self) -> None:
+        """
+        Forget cached intents, e.g. after changing the LLM configuration.
+        """
+        self._cached_intent.cache_clear()
+    
+    def _run_action(self, service: str, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the handler registered for a service's action.
+        
+        Args:
+            service: Service the intent targets
+            intent: Extracted intent from request
+        
+        Returns:
+            Result of the service operation
+        """
+        action = intent.get('action', '')
+        handler = self._actions[service].get(action)
+        if handler is None:
             return {
-                'service': 'multi',
-                'action': 'interpret',
-                'details': request
+                'status': 'error',
+                'message': f"Unsupported {service} action: {action}"
             }
+        
+        return {
+            'status': 'success',
+            'result': handler(intent.get('details', {}))
+        }
     
     def _handle_email_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -133,27 +431,7 @@ class WorkspaceIntegration:
         Returns:
             Result of email operation
         """
-        action = intent.get('action', '')
-        details = intent.get('details', {})
-        
-        if action == 'send':
-            return {
-                'status': 'success',
-                'result': self.gmail_client.create_item(
-                    to=details.get('to', ''),
-                    subject=details.get('subject', ''),
-                    body=details.get('body', '')
-                )
-            }
-        elif action == 'read':
-            return {
-                'status': 'success',
-                'result': self.gmail_client.list_items(
-                    max_results=details.get('max_results', 10),
-                    query=details.get('query')
-                )
-            }
-        # Add more email actions as needed
+        return self._run_action('email', intent)
     
     def _handle_calendar_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -165,30 +443,7 @@ class WorkspaceIntegration:
         Returns:
             Result of calendar operation
         """
-        action = intent.get('action', '')
-        details = intent.get('details', {})
-        
-        if action == 'create':
-            return {
-                'status': 'success',
-                'result': self.calendar_client.create_item(
-                    summary=details.get('summary', ''),
-                    start_time=details.get('start_time'),
-                    end_time=details.get('end_time'),
-                    description=details.get('description'),
-                    attendees=details.get('attendees')
-                )
-            }
-        elif action == 'list':
-            return {
-                'status': 'success',
-                'result': self.calendar_client.list_items(
-                    max_results=details.get('max_results', 10),
-                    time_min=details.get('time_min'),
-                    time_max=details.get('time_max')
-                )
-            }
-        # Add more calendar actions as needed
+        return self._run_action('calendar', intent)
     
     def _handle_drive_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -200,27 +455,7 @@ class WorkspaceIntegration:
         Returns:
             Result of drive operation
         """
-        action = intent.get('action', '')
-        details = intent.get('details', {})
-        
-        if action == 'upload':
-            return {
-                'status': 'success',
-                'result': self.drive_client.upload_file(
-                    local_path=details.get('local_path', ''),
-                    name=details.get('name'),
-                    parent_id=details.get('parent_id')
-                )
-            }
-        elif action == 'list':
-            return {
-                'status': 'success',
-                'result': self.drive_client.list_items(
-                    max_results=details.get('max_results', 10),
-                    query=details.get('query')
-                )
-            }
-        # Add more drive actions as needed
+        return self._run_action('drive', intent)
     
     def _handle_sheets_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -232,26 +467,7 @@ class WorkspaceIntegration:
         Returns:
             Result of sheets operation
         """
-        action = intent.get('action', '')
-        details = intent.get('details', {})
-        
-        if action == 'create':
-            return {
-                'status': 'success',
-                'result': self.sheets_client.create_item(
-                    title=details.get('title', ''),
-                    sheets=details.get('sheets')
-                )
-            }
-        elif action == 'read':
-            return {
-                'status': 'success',
-                'result': self.sheets_client.read_values(
-                    spreadsheet_id=details.get('spreadsheet_id', ''),
-                    range_name=details.get('range_name', '')
-                )
-            }
-        # Add more sheets actions as needed
+        return self._run_action('sheets', intent)
     
     def _handle_docs_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -263,65 +479,396 @@ class WorkspaceIntegration:
         Returns:
             Result of docs operation
         """
-        action = intent.get('action', '')
-        details = intent.get('details', {})
+        return self._run_action('docs', intent)
+    
+    def _send_email(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send an email.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.gmail_client.create_item(
+            to=details.get('to', ''),
+            subject=details.get('subject', ''),
+            body=details.get('body', '')
+        )
+    
+    def _read_emails(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        List emails matching a query.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.gmail_client.list_items(
+            max_results=details.get('max_results', 10),
+            query=details.get('query')
+        )
+    
+    def _create_event(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a calendar event.
         
-        if action == 'create':
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.calendar_client.create_item(
+            summary=details.get('summary', ''),
+            start_time=details.get('start_time'),
+            end_time=details.get('end_time'),
+            description=details.get('description'),
+            attendees=details.get('attendees')
+        )
+    
+    def _list_events(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        List calendar events in a time range.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.calendar_client.list_items(
+            max_results=details.get('max_results', 10),
+            time_min=details.get('time_min'),
+            time_max=details.get('time_max')
+        )
+    
+    def _upload_file(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Upload a local file to Drive.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.drive_client.upload_file(
+            local_path=details.get('local_path', ''),
+            name=details.get('name'),
+            parent_id=details.get('parent_id')
+        )
+    
+    def _list_files(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        List Drive files matching a query.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.drive_client.list_items(
+            max_results=details.get('max_results', 10),
+            query=details.get('query')
+        )
+    
+    def _create_spreadsheet(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a spreadsheet.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.sheets_client.create_item(
+            title=details.get('title', ''),
+            sheets=details.get('sheets')
+        )
+    
+    def _read_values(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read values from a spreadsheet range.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.sheets_client.read_values(
+            spreadsheet_id=details.get('spreadsheet_id', ''),
+            range_name=details.get('range_name', '')
+        )
+    
+    def _create_document(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a document.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.docs_client.create_item(
+            title=details.get('title', ''),
+            content=details.get('content')
+        )
+    
+    def _append_text(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append text to a document.
+        
+        Args:
+            details: Action parameters from the extracted intent
+        
+        Returns:
+            Service client response
+        """
+        return self.docs_client.append_text(
+            document_id=details.get('document_id', ''),
+            text=details.get('text', '')
+        )
+    
+    def _handle_multi_service_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle complex requests involving multiple services.
+        
+        Args:
+            intent: Extracted intent from request; if it already holds
+                per-service ``actions``, no further LLM call is made
+        
+        Returns:
+            Result of multi-service operation
+        """
+        try:
+            sub_requests, results = self._plan_multi_service_request(intent)
+            
+            # Execute actions for each service concurrently with its handler
+            futures = {
+                service: self._executor.submit(handler, service_intent)
+                for service, (handler, service_intent) in sub_requests.items()
+            }
+            
+            # Collect results; a failing service doesn't affect the others
+            for service, future in futures.items():
+                try:
+                    results[service] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error processing {service} request: {e}")
+                    results[service] = {
+                        'status': 'error',
+                        'message': str(e)
+                    }
+            
             return {
                 'status': 'success',
-                'result': self.docs_client.create_item(
-                    title=details.get('title', ''),
-                    content=details.get('content')
-                )
+                'results': results
             }
-        elif action == 'append':
+        
+        except Exception as e:
             return {
-                'status': 'success',
-                'result': self.docs_client.append_text(
-                    document_id=details.get('document_id', ''),
-                    text=details.get('text', '')
-                )
+                'status': 'error',
+                'message': f"Multi-service request processing failed: {e}"
             }
-        # Add more docs actions as needed
     
-    def _handle_multi_service_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_multi_service_request(self, intent: Dict[str, Any]) -> Tuple[
+            Dict[str, Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], Dict[str, Any]]], 
+            Dict[str, Dict[str, Any]]]:
         """
-        Handle complex requests involving multiple services.
+        Split a multi-service intent into per-service handler calls.
+        
+        Per-service intents are built directly from the actions, without
+        extracting each service's intent again.
         
         Args:
             intent: Extracted intent from request
         
         Returns:
-            Result of multi-service operation
+            Handler and intent for each supported service, and error results
+            for the unsupported ones
         """
-        # Use LLM to break down complex request into service-specific actions
-        breakdown_prompt = f"""
-        Break down this multi-service request into specific actions:
-        {intent.get('details', '')}
+        actions = intent.get('actions')
+        if not isinstance(actions, dict):
+            actions = self._decompose_request(intent)
+        
+        sub_requests = {}
+        errors = {}
+        
+        for service, service_actions in actions.items():
+            service_intent = {
+                'service': service,
+                'action': service_actions.get('action'),
+                'details': service_actions.get('details', {})
+            }
+            
+            # Nested multi intents aren't expanded again
+            handler = self._dispatch.get(service) if service != 'multi' else None
+            if handler is None:
+                errors[service] = {
+                    'status': 'error',
+                    'message': f"Unsupported service: {service}"
+                }
+            else:
+                sub_requests[service] = (handler, service_intent)
         
-        Provide a JSON with a list of actions for each service.
+        return sub_requests, errors
+    
+    def _decompose_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use LLM to break down a complex request into per-service intents.
+        
+        Args:
+            intent: Extracted intent from request
+        
+        Returns:
+            Mapping of service name to its action and details
         """
+        # Structured details are sent as JSON rather than as a Python repr,
+        # serialized by orjson like the batch prompts
+        details = intent.get('details', '')
+        prompt = details if isinstance(details, str) else orjson.dumps(details).decode()
         
         breakdown = self.llm_client.generate_response(
-            prompt=breakdown_prompt, 
-            system_message="You are a workflow decomposition assistant."
+            prompt=prompt, 
+            system_message=DECOMPOSITION_SYSTEM_PROMPT,
+            response_format=JSON_RESPONSE_FORMAT,
+            use_context=False
         )
         
+        return orjson.loads(breakdown)
+
+class AsyncWorkspaceIntegration:
+    """
+    Asyncio front end for WorkspaceIntegration.
+    
+    The Google API and Groq clients are blocking, so each call runs in a
+    worker thread; independent calls, such as the sub-requests of a
+    multi-service request, are awaited together with ``asyncio.gather``.
+    """
+    
+    def __init__(self, 
+                 credentials: GoogleWorkspaceAuth, 
+                 llm_client: Optional[GroqLLMClient] = None, 
+                 max_concurrent: int = MULTI_SERVICE_WORKERS):
+        """
+        Initialize async Workspace Integration.
+        
+        Args:
+            credentials: Authenticated Google Workspace credentials
+            llm_client: Optional Groq LLM client for natural language processing
+            max_concurrent: Most blocking calls in flight at once, across all
+                requests awaited on this integration
+        """
+        # The synchronous integration holds the clients and their shared
+        # transport, and remains the façade for synchronous callers
+        self.workspace = WorkspaceIntegration(credentials, llm_client)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Dedicated pool bounding the blocking calls in flight, so gathering
+        # many requests stays within the per-user rate limits. Unlike an
+        # asyncio primitive, it isn't bound to the event loop it was first
+        # used on, so the integration can be awaited from several loops.
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent)
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking call in a worker thread once a slot is free.
+        
+        Args:
+            func: Blocking callable
+            *args: Arguments for the callable
+        
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    def close(self) -> None:
+        """
+        Release the worker threads of this integration and the one it wraps.
+        
+        Calls already running are left to finish in the background.
+        """
+        self._executor.shutdown(wait=False)
+        self.workspace.close()
+    
+    async def __aenter__(self) -> 'AsyncWorkspaceIntegration':
+        """Use the integration as an async context manager that closes it on exit."""
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the integration."""
+        self.close()
+    
+    async def process_natural_language_request(self, request: str) -> Dict[str, Any]:
+        """
+        Process a natural language request across multiple services.
+        
+        Args:
+            request: Natural language request from the user
+        
+        Returns:
+            Processed request result with action details
+        """
         try:
-            actions = json.loads(breakdown)
-            results = {}
+            # Use LLM to interpret the request
+            intent = await self._run_blocking(self.workspace._extract_intent, request)
             
-            # Execute actions for each service
-            for service, service_actions in actions.items():
-                service_intent = {
-                    'service': service,
-                    'action': service_actions.get('action'),
-                    'details': service_actions.get('details', {})
-                }
-                
-                results[service] = self.process_natural_language_request(
-                    json.dumps(service_intent)
-                )
+            if intent['service'] == 'multi':
+                return await self._handle_multi_service_request(intent)
+            
+            return await self._run_blocking(self.workspace._process_intent, intent)
+        
+        except Exception as e:
+            self.logger.error(f"Error processing request: {e}")
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+    
+    async def _handle_multi_service_request(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle complex requests involving multiple services.
+        
+        Args:
+            intent: Extracted intent from request
+        
+        Returns:
+            Result of multi-service operation
+        """
+        try:
+            sub_requests, results = await self._run_blocking(
+                self.workspace._plan_multi_service_request, 
+                intent
+            )
+            
+            # Run every service's handler at once; a failing service doesn't
+            # affect the others
+            services = list(sub_requests)
+            outcomes = await asyncio.gather(
+                *[self._run_blocking(handler, service_intent) 
+                  for handler, service_intent in sub_requests.values()],
+                return_exceptions=True
+            )
+            
+            for service, outcome in zip(services, outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Error processing {service} request: {outcome}")
+                    results[service] = {
+                        'status': 'error',
+                        'message': str(outcome)
+                    }
+                else:
+                    results[service] = outcome
             
             return {
                 'status': 'success',
@@ -4,13 +4,25 @@ LLM Client module for Google Workspace Intelligent Agent.
 Provides natural language processing capabilities using Groq API.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional, Deque, Iterator
+from collections import deque
 import os
 import logging
+import threading
 
 from groq import Groq
 from pydantic import BaseModel, Field
 
+# Upper bound on in-flight Groq requests per process, shared by all clients,
+# so concurrent callers stay under the account's rate limit
+_GROQ_SEMAPHORE = threading.BoundedSemaphore(int(os.getenv('GROQ_CONCURRENCY', '8')))
+
+# Completion length cap for calls that don't ask for a specific one
+DEFAULT_MAX_TOKENS = 1024
+
+# Summary instructions; only the length limit is filled in per call
+SUMMARY_SYSTEM_PROMPT = "Summarize the following text concisely in under {max_length} characters:"
+
 class ConversationContext(BaseModel):
     """
     Represents the context of a conversation.
@@ -19,9 +31,13 @@ class ConversationContext(BaseModel):
     for language model interactions.
     """
     
-    messages: List[Dict[str, str]] = Field(default_factory=list)
+    messages: Deque[Dict[str, str]] = Field(default_factory=deque)
     max_context_length: int = 10
     
+    def model_post_init(self, __context: Any) -> None:
+        """Bound the message history, so old messages drop off in O(1)."""
+        self.messages = deque(self.messages, maxlen=self.max_context_length)
+    
     def add_message(self, role: str, content: str) -> None:
         """
         Add a message to the conversation context.
@@ -30,11 +46,8 @@ class ConversationContext(BaseModel):
             role: Message role (system, user, assistant)
             content: Message content
         """
+        # The bounded deque discards the oldest message once full
         self.messages.append({"role": role, "content": content})
-        
-        # Trim context if it exceeds max length
-        if len(self.messages) > self.max_context_length:
-            self.messages = self.messages[-self.max_context_length:]
     
     def clear(self) -> None:
         """Reset conversation context."""
@@ -48,6 +61,9 @@ class GroqLLMClient:
     processing queries, and managing conversation context.
     """
     
+    # Smaller, faster model for summaries, whose length is capped anyway
+    SUMMARIZATION_MODEL = os.getenv('GROQ_SUMMARIZATION_MODEL', 'llama-3.1-8b-instant')
+    
     def __init__(self, 
                  api_key: Optional[str] = None, 
                  model: str = 'llama2-70b-4096'):
@@ -66,26 +82,87 @@ class GroqLLMClient:
         self.model = model
         self.context = ConversationContext()
         
-        # Configure logging
-        logging.basicConfig(
-            level=os.getenv('LOG_LEVEL', 'INFO'),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Logging is configured by the application entry point
         self.logger = logging.getLogger(__name__)
     
     def generate_response(self, 
                           prompt: str, 
-                          system_message: Optional[str] = None) -> str:
+                          system_message: Optional[str] = None,
+                          response_format: Optional[Dict[str, str]] = None,
+                          use_context: bool = True,
+                          stream: bool = False,
+                          target_length: Optional[int] = None,
+                          max_tokens: int = DEFAULT_MAX_TOKENS,
+                          model: Optional[str] = None) -> str:
         """
         Generate a response using the LLM.
         
         Args:
             prompt: User's input/query
             system_message: Optional system-level context/instruction
+            response_format: Optional structured output mode, e.g.
+                ``{"type": "json_object"}`` to have Groq guarantee valid JSON
+            use_context: Whether to send the conversation history and record
+                this exchange in it; stateless calls pass False to keep the
+                prompt size constant
+            stream: Whether to stream the completion as it is generated
+            target_length: With streaming, stop reading once this many
+                characters have arrived and cancel the rest of the generation
+            max_tokens: Maximum number of tokens to generate
+            model: Model to use for this call instead of the client's model
         
         Returns:
             Generated response from the LLM
         """
+        params = self._build_request(
+            prompt, system_message, response_format, use_context, max_tokens, model
+        )
+        
+        try:
+            if stream:
+                generated_text = self._read_stream(
+                    self._stream_completion(params),
+                    target_length
+                )
+            else:
+                with _GROQ_SEMAPHORE:
+                    response = self.client.chat.completions.create(**params)
+                
+                # Extract response text
+                generated_text = response.choices[0].message.content
+            
+            # Update conversation context
+            if use_context:
+                self.context.add_message("user", prompt)
+                self.context.add_message("assistant", generated_text)
+            
+            return generated_text
+        
+        except Exception as e:
+            self.logger.error(f"LLM generation error: {e}")
+            raise
+    
+    def _build_request(self, 
+                       prompt: str, 
+                       system_message: Optional[str], 
+                       response_format: Optional[Dict[str, str]], 
+                       use_context: bool, 
+                       max_tokens: int, 
+                       model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the parameters of a chat completion request.
+        
+        Args:
+            prompt: User's input/query
+            system_message: Optional system-level context/instruction
+            response_format: Optional structured output mode
+            use_context: Whether to send the conversation history
+            max_tokens: Maximum number of tokens to generate
+            model: Optional model overriding the client's model
+        
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
         # Prepare messages
         messages = []
         
@@ -96,7 +173,8 @@ class GroqLLMClient:
             })
         
         # Add conversation history
-        messages.extend(self.context.messages)
+        if use_context:
+            messages.extend(self.context.messages)
         
         # Add current user prompt
         messages.append({
@@ -104,45 +182,98 @@ class GroqLLMClient:
             "content": prompt
         })
         
+        # Prepare request parameters
+        params = {
+            'messages': messages,
+            'model': model or self.model,
+            'max_tokens': max_tokens,
+            'temperature': 0.7
+        }
+        if response_format:
+            params['response_format'] = response_format
+        return params
+    
+    def _stream_completion(self, params: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream a chat completion, holding a Groq request slot until closed.
+        
+        Args:
+            params: Keyword arguments for ``chat.completions.create``
+        
+        Yields:
+            Non-empty pieces of the generated text
+        """
+        with _GROQ_SEMAPHORE:
+            response = self.client.chat.completions.create(stream=True, **params)
+            try:
+                for chunk in response:
+                    content = chunk.choices[0].delta.content if chunk.choices else None
+                    if content:
+                        yield content
+            finally:
+                # Closing the stream stops the remaining generation
+                response.close()
+    
+    @staticmethod
+    def _read_stream(deltas: Iterator[str], 
+                     target_length: Optional[int] = None) -> str:
+        """
+        Collect the text of a streamed completion.
+        
+        Args:
+            deltas: Pieces of the generated text, from ``_stream_completion``
+            target_length: Optional number of characters after which the
+                stream is closed early
+        
+        Returns:
+            Text received from the stream
+        """
+        parts = []
+        received = 0
+        
         try:
-            response = self.client.chat.completions.create(
-                messages=messages,
-                model=self.model,
-                max_tokens=1024,
-                temperature=0.7
-            )
-            
-            # Extract response text
-            generated_text = response.choices[0].message.content
-            
-            # Update conversation context
-            self.context.add_message("user", prompt)
-            self.context.add_message("assistant", generated_text)
-            
-            return generated_text
+            for content in deltas:
+                parts.append(content)
+                received += len(content)
+                if target_length is not None and received >= target_length:
+                    break
+        finally:
+            deltas.close()
         
-        except Exception as e:
-            self.logger.error(f"LLM generation error: {e}")
-            raise
+        return ''.join(parts)
     
-    def summarize_text(self, text: str, max_length: int = 200) -> str:
+    def summarize_text(self, 
+                       text: str, 
+                       max_length: int = 200, 
+                       model: Optional[str] = None) -> str:
         """
         Summarize given text using LLM.
         
         Args:
             text: Text to summarize
             max_length: Maximum summary length
+            model: Model to use; defaults to ``SUMMARIZATION_MODEL``
         
         Returns:
             Summarized text
         """
-        system_message = f"Summarize the following text concisely in under {max_length} characters:"
+        system_message = SUMMARY_SYSTEM_PROMPT.format(max_length=max_length)
+        
+        # A token is roughly three characters of English text, so the cap
+        # keeps generation close to the length actually needed
+        max_tokens = max(32, max_length // 3 + 8)
         
         summary = self.generate_response(
             prompt=text, 
-            system_message=system_message
+            system_message=system_message,
+            use_context=False,
+            stream=True,
+            target_length=max_length,
+            max_tokens=max_tokens,
+            model=model or self.SUMMARIZATION_MODEL
         )
         
+        # Safety net for summaries that still run slightly long
         return summary[:max_length]
     
     def reset_context(self) -> None:
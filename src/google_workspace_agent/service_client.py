@@ -6,12 +6,413 @@ Google Workspace service clients.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Callable
+import asyncio
+import functools
 import logging
+import os
+import random
+import socket
+import threading
+import time
 
+import orjson
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp, Request
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
+from googleapiclient.model import JsonModel
+
+# Held while refreshing an access token, so threads sharing one set of
+# credentials wait for a single refresh instead of each performing their own
+_REFRESH_LOCK = threading.Lock()
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Responses meaning the request was turned away before being processed,
+# so even non-idempotent requests such as a POST can be sent again
+REJECTED_STATUSES = frozenset({429, 503})
+
+# Methods that can be repeated without applying a change twice; anything
+# else, e.g. sending a message, is only retried when it was rejected
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+
+# Transport failures worth retrying: dropped connections and timeouts.
+# socket.timeout only became an alias of TimeoutError in Python 3.10.
+RETRYABLE_EXCEPTIONS = (ConnectionError, TimeoutError, socket.timeout)
+
+# Upper bound on the delay between two attempts of the same request
+MAX_BACKOFF_SECONDS = 64
+
+# Discovery documents downloaded for services the API client doesn't
+# bundle, keyed by (service name, version), so each is fetched only once.
+# Documents are kept serialized, for the same reason as the bundled ones.
+_FETCHED_DISCOVERY_DOCUMENTS: Dict[Tuple[str, str], bytes] = {}
+
+@functools.lru_cache(maxsize=None)
+def _read_discovery_document(service_name: str, version: str) -> Optional[str]:
+    """
+    Read the discovery document bundled with the API client.
+    
+    Documents are cached as JSON text rather than parsed: building a
+    service modifies the parsed document in place, as each collection is
+    first built, so every build needs its own copy.
+    
+    Args:
+        service_name: Name of the Google Workspace service
+        version: Version of the service API
+    
+    Returns:
+        Discovery document JSON, or None if none is bundled
+    """
+    return discovery_cache.get_static_doc(service_name, version)
+
+def _load_discovery_document(service_name: str, 
+                             version: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a fresh copy of the discovery document bundled with the API client.
+    
+    The JSON is read from disk only once and decoded with ``orjson``, like
+    the API responses, which is faster than copying a parsed document.
+    
+    Args:
+        service_name: Name of the Google Workspace service
+        version: Version of the service API
+    
+    Returns:
+        Parsed discovery document, or None if none is bundled
+    """
+    document = _read_discovery_document(service_name, version)
+    return orjson.loads(document) if document is not None else None
+
+class _OrjsonModel(JsonModel):
+    """
+    JSON model that decodes API responses with ``orjson``.
+    
+    Responses such as full Gmail messages carry large nested payloads, which
+    ``orjson`` parses considerably faster than the standard library.
+    """
+    
+    def deserialize(self, content: Any) -> Any:
+        """
+        Decode a response body.
+        
+        Args:
+            content: Raw response body, as bytes or str
+        
+        Returns:
+            Decoded body, or the body as text if it is not valid JSON
+        """
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Jittered exponential delay before retrying a request.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+    
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+
+def _retryable_statuses(method: str) -> frozenset:
+    """
+    Statuses after which a request with the given method can be resent.
+    
+    Args:
+        method: HTTP method of the request
+    
+    Returns:
+        Every retryable status for idempotent methods, otherwise only the
+        statuses meaning the request was rejected unprocessed
+    """
+    return RETRYABLE_STATUSES if method.upper() in IDEMPOTENT_METHODS else REJECTED_STATUSES
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests start per second.
+    """
+    
+    def __init__(self, rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second, which is also the burst size
+        """
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Take tokens, sleeping until they are available.
+        
+        Args:
+            tokens: Number of requests about to start
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate, 
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            
+            # Reserve the tokens now so concurrent callers queue up behind them
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate
+        
+        if wait > 0:
+            time.sleep(wait)
+
+class _ResponseCache:
+    """
+    Bounded, thread-safe in-memory cache for ``httplib2``.
+    
+    With a cache attached, ``httplib2`` revalidates stored GET responses
+    that carry an ETag by sending ``If-None-Match``; a ``304 Not Modified``
+    reply is answered from the cache without transferring the body again.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Number of responses kept before the least
+                recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key of the request
+        
+        Returns:
+            Serialized response, or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a response, evicting the least recently used one if full.
+        
+        Args:
+            key: Cache key of the request
+            value: Serialized response
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        """
+        Remove a cached response, if present.
+        
+        Args:
+            key: Cache key of the request
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+class _ThreadLocalHttp:
+    """
+    Authorized HTTP transport with one persistent connection pool per thread.
+    
+    ``httplib2.Http`` keeps connections alive between requests but is not
+    thread-safe, so each thread gets its own ``AuthorizedHttp`` that it
+    reuses for all of its requests.
+    """
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 cache: Optional[_ResponseCache] = None):
+        """
+        Initialize the transport.
+        
+        Args:
+            credentials: Google OAuth 2.0 credentials used to sign requests
+            cache: Optional response cache shared by all threads, used to
+                revalidate GET responses with their ETag
+        """
+        self.credentials = credentials
+        self._cache = cache
+        self._local = threading.local()
+    
+    def _get_http(self) -> AuthorizedHttp:
+        """
+        Get the authorized connection for the current thread.
+        
+        Returns:
+            AuthorizedHttp bound to the current thread
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            connection = build_http()
+            if self._cache is not None:
+                connection.cache = self._cache
+                # Only use ETags for conditional GETs; don't turn updates
+                # into If-Match requests that fail on concurrent changes
+                connection.optimistic_concurrency_methods = []
+            
+            http = AuthorizedHttp(self.credentials, http=connection)
+            self._local.http = http
+        return http
+    
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Send a request over the current thread's connection.
+        
+        Returns:
+            Tuple of response and content, as returned by httplib2
+        """
+        self._refresh_if_needed()
+        return self._get_http().request(*args, **kwargs)
+    
+    def _refresh_if_needed(self) -> None:
+        """
+        Refresh the access token once it is expired or close to expiring.
+        """
+        if self.credentials.valid:
+            return
+        
+        with _REFRESH_LOCK:
+            # Another thread may have refreshed while we were waiting
+            if not self.credentials.valid:
+                self.credentials.refresh(Request(self._get_http().http))
+    
+    def __getattr__(self, name: str) -> Any:
+        # Delegate transport attributes (timeout, redirect_codes, close, ...)
+        # to the current thread's connection
+        if name == '_local':
+            raise AttributeError(name)
+        return getattr(self._get_http(), name)
+
+class _PacedHttp:
+    """
+    Per-client view of a possibly shared transport.
+    
+    Adds the client's own rate limit and retries on top of the transport's
+    pooled connections, so clients sharing connections keep separate
+    per-service limits.
+    """
+    
+    def __init__(self, 
+                 transport: _ThreadLocalHttp, 
+                 max_qps: Optional[float] = None, 
+                 max_retries: int = 0):
+        """
+        Initialize the paced transport.
+        
+        Args:
+            transport: Authorized transport that sends the requests
+            max_qps: Optional limit on requests started per second
+            max_retries: Times to retry rate-limited or failed requests
+        """
+        self.transport = transport
+        self.max_retries = max_retries
+        self._bucket = _TokenBucket(max_qps) if max_qps else None
+    
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Send a request through the transport.
+        
+        Requests are paced by the rate limit. Responses with a retryable
+        status, dropped connections and timeouts are retried with jittered
+        exponential backoff. A 500, 502 or 504, a dropped connection or a
+        timeout may come after the server already applied the request, so
+        those are only retried for idempotent methods.
+        
+        Returns:
+            Tuple of response and content, as returned by httplib2
+        
+        Raises:
+            The transport error, once the retries are used up
+        """
+        method = kwargs.get('method', args[1] if len(args) > 1 else 'GET')
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retryable_statuses = _retryable_statuses(method)
+        
+        for attempt in range(self.max_retries + 1):
+            if self._bucket is not None:
+                self._bucket.acquire()
+            
+            try:
+                resp, content = self.transport.request(*args, **kwargs)
+            except RETRYABLE_EXCEPTIONS:
+                if not idempotent or attempt == self.max_retries:
+                    raise
+            else:
+                if resp.status not in retryable_statuses or attempt == self.max_retries:
+                    return resp, content
+            
+            time.sleep(_backoff_delay(attempt))
+    
+    def pace(self, requests: int) -> None:
+        """
+        Wait for the rate limit to allow extra requests.
+        
+        A batch HTTP request is a single round trip, but the API counts
+        each of its parts against the quota.
+        
+        Args:
+            requests: Requests sent on top of the one being paced already
+        """
+        if self._bucket is not None and requests > 0:
+            self._bucket.acquire(requests)
+    
+    def __getattr__(self, name: str) -> Any:
+        # Delegate everything else (credentials, timeout, ...) to the transport
+        if name == 'transport':
+            raise AttributeError(name)
+        return getattr(self.transport, name)
+
+def create_authorized_http(credentials: Credentials, 
+                           enable_caching: bool = True) -> _ThreadLocalHttp:
+    """
+    Create an authorized transport that several service clients can share.
+    
+    Clients given the same transport reuse its kept-alive connections, so
+    only the first request from each thread pays for the TLS handshake.
+    
+    Args:
+        credentials: Google OAuth 2.0 credentials used to sign requests
+        enable_caching: Whether to revalidate GET responses via ETag
+    
+    Returns:
+        Authorized transport to pass as ``http`` to service clients
+    """
+    return _ThreadLocalHttp(
+        credentials, 
+        cache=_ResponseCache() if enable_caching else None
+    )
 
 class BaseServiceClient(ABC):
     """
@@ -20,10 +421,35 @@ class BaseServiceClient(ABC):
     Provides common functionality and interface for service-specific clients.
     """
     
+    # Maximum number of sub-requests sent in a single batch HTTP request
+    MAX_BATCH_SIZE = 100
+    
+    # Client-side limit on API requests started per second
+    MAX_QPS = 10
+    
+    # Retries for rate-limited (429) and transient 5xx responses
+    MAX_RETRIES = int(os.getenv('MAX_API_RETRIES', '3'))
+    
+    # Keep recent responses so unchanged items are revalidated via ETag
+    # instead of downloaded again
+    ENABLE_CACHING = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
+    
+    # Worker threads for bulk calls the service cannot batch; keep this at
+    # or below MAX_QPS, since extra workers just wait on the rate limiter
+    MAX_WORKERS = 10
+    
+    # Builders of the (unexecuted) request retrieving or deleting a single
+    # item by ID, suitable for batching. Clients that can batch these calls
+    # define them as methods; bulk calls of the others use get_item and
+    # delete_item on a pool of threads instead.
+    _get_request: Optional[Callable[[str], HttpRequest]] = None
+    _delete_request: Optional[Callable[[str], HttpRequest]] = None
+    
     def __init__(self, 
                  credentials: Credentials, 
                  service_name: str, 
-                 service_version: str):
+                 service_version: str,
+                 http: Optional[_ThreadLocalHttp] = None):
         """
         Initialize the base service client.
         
@@ -31,6 +457,8 @@ class BaseServiceClient(ABC):
             credentials: Google OAuth 2.0 credentials
             service_name: Name of the Google Workspace service
             service_version: Version of the service API
+            http: Optional transport from ``create_authorized_http`` shared
+                with other clients; a new one is created if omitted
         """
         self._credentials = credentials
         self._service_name = service_name
@@ -39,13 +467,58 @@ class BaseServiceClient(ABC):
         # Configure logging
         self._logger = logging.getLogger(f'{self.__class__.__name__}')
         
+        # Authorized transport that reuses connections across calls
+        self._http = _PacedHttp(
+            http or create_authorized_http(credentials, self.ENABLE_CACHING),
+            max_qps=self.MAX_QPS, 
+            max_retries=self.MAX_RETRIES
+        )
+        
         # Build service client
+        self._service = self._build_service(service_name, service_version)
+        
+        # Resource collections already built from the service
+        self._collections: Dict[tuple, Any] = {}
+        self._collections_service = self._service
+        
+        # Reads currently running, shared with callers asking for the same
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def _build_service(self, service_name: str, service_version: str) -> Any:
+        """
+        Build a service object on this client's authorized transport.
+        
+        Args:
+            service_name: Name of the Google Workspace service
+            service_version: Version of the service API
+        
+        Returns:
+            Service resource for the API
+        """
         try:
-            self._service = build(
+            key = (service_name, service_version)
+            fetched = _FETCHED_DISCOVERY_DOCUMENTS.get(key)
+            document = (orjson.loads(fetched) if fetched is not None 
+                        else _load_discovery_document(service_name, service_version))
+            if document is not None:
+                return build_from_document(
+                    document, 
+                    http=self._http, 
+                    model=_OrjsonModel('dataWrapper' in document.get('features', []))
+                )
+            
+            service = build(
                 serviceName=service_name, 
                 version=service_version, 
-                credentials=credentials
+                http=self._http,
+                cache_discovery=False
             )
+            
+            # Remember the downloaded document, so later clients skip the fetch;
+            # no collection has been built yet, so it is still unmodified
+            _FETCHED_DISCOVERY_DOCUMENTS[key] = orjson.dumps(service._rootDesc)
+            return service
         except Exception as e:
             self._logger.error(f"Failed to build {service_name} service: {e}")
             raise
@@ -121,6 +594,324 @@ class BaseServiceClient(ABC):
         """
         pass
     
+    def _collection(self, *names: str) -> Any:
+        """
+        Get a resource collection of the service, building it only once.
+        
+        Calling e.g. ``service.users().messages()`` builds a new resource,
+        with every method recreated from the discovery document, on each
+        call. Collections are immutable, so they are built once and reused.
+        
+        Args:
+            *names: Path of collection names, e.g. ``('users', 'messages')``
+        
+        Returns:
+            Resource collection
+        """
+        if self._collections_service is not self._service:
+            # The service was replaced; drop collections of the old one
+            self._collections = {}
+            self._collections_service = self._service
+        
+        collection = self._collections.get(names)
+        if collection is None:
+            collection = self._service
+            for name in names:
+                collection = getattr(collection, name)()
+            self._collections[names] = collection
+        return collection
+    
+    def _paginate(self, 
+                  collection: Any, 
+                  request: HttpRequest, 
+                  items_key: str, 
+                  max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a list request, following its next pages.
+        
+        While the items of one page are consumed, the next page is already
+        being fetched in a background thread.
+        
+        Args:
+            collection: Resource collection providing ``list_next``
+            request: Request for the first page
+            items_key: Response key holding the items of a page
+            max_pages: Maximum number of pages to fetch (None for all)
+        
+        Yields:
+            Items from each page, in order
+        """
+        response = request.execute()
+        pages = 1
+        executor = None
+        
+        try:
+            while True:
+                next_request = None
+                if max_pages is None or pages < max_pages:
+                    next_request = collection.list_next(request, response)
+                
+                if next_request is None:
+                    yield from response.get(items_key, [])
+                    return
+                
+                # Fetch the next page while the caller consumes this one
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                future = executor.submit(next_request.execute)
+                
+                yield from response.get(items_key, [])
+                request, response = next_request, future.result()
+                pages += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    def _single_flight(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Run a read, sharing it with concurrent callers of the same read.
+        
+        While a read for ``key`` is running, other threads asking for the
+        same key wait for its outcome instead of sending a duplicate
+        request. Callers receive the same result object, so they shouldn't
+        modify it. Nothing is cached once the read completes.
+        
+        Args:
+            key: Identifies the read, e.g. ``('get', item_id)``
+            fetch: Performs the read
+        
+        Returns:
+            Result of the read
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _execute_batch(self, 
+                       requests: Dict[str, HttpRequest]) -> Dict[str, Any]:
+        """
+        Execute requests as batch HTTP requests of up to ``MAX_BATCH_SIZE``.
+        
+        Each batch is sent as a single multipart HTTP round trip instead of
+        one round trip per request, paced as one request per part. Parts
+        that fail with a retryable status, such as a 429 for the batch
+        being too fast, come back inside a successful response, so they are
+        sent again in a new batch after a backoff.
+        
+        Args:
+            requests: Requests keyed by the ID used to report their result
+        
+        Returns:
+            Responses keyed by request ID; failed requests are logged and
+            left out
+        """
+        results = {}
+        failed = {}
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                failed[request_id] = exception
+            else:
+                results[request_id] = response
+        
+        pending = list(requests.items())
+        for attempt in range(self.MAX_RETRIES + 1):
+            failed = {}
+            for start in range(0, len(pending), self.MAX_BATCH_SIZE):
+                parts = pending[start:start + self.MAX_BATCH_SIZE]
+                batch = self._service.new_batch_http_request(callback=callback)
+                for request_id, request in parts:
+                    batch.add(request, request_id=request_id)
+                
+                try:
+                    self._http.pace(len(parts) - 1)
+                    batch.execute()
+                except HttpError as error:
+                    self.handle_api_error(error)
+            
+            pending = [
+                (request_id, requests[request_id]) 
+                for request_id, error in failed.items() 
+                if isinstance(error, HttpError) 
+                and error.resp.status in _retryable_statuses(requests[request_id].method)
+            ]
+            if not pending or attempt == self.MAX_RETRIES:
+                break
+            time.sleep(_backoff_delay(attempt))
+        
+        for request_id, error in failed.items():
+            self._logger.error(f"Batched request {request_id} failed: {error}")
+        
+        return results
+    
+    def get_items_bulk(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several items using batch HTTP requests.
+        
+        Clients without batched retrieval call ``get_item`` concurrently on
+        up to ``MAX_WORKERS`` threads instead.
+        
+        Args:
+            item_ids: Unique identifiers for the items
+        
+        Returns:
+            Item details keyed by item ID; items that could not be
+            retrieved are left out
+        """
+        if self._get_request is None:
+            return self._get_items_concurrently(item_ids)
+        
+        return self._execute_batch({
+            item_id: self._get_request(item_id) for item_id in item_ids
+        })
+    
+    def _get_items_concurrently(self, 
+                                item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several items with ``get_item`` on a pool of threads.
+        
+        Args:
+            item_ids: Unique identifiers for the items
+        
+        Returns:
+            Item details keyed by item ID; items that could not be
+            retrieved are left out
+        """
+        def get_item(item_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_item(item_id)
+            except HttpError:
+                # Already logged by handle_api_error
+                return None
+        
+        unique_ids = list(dict.fromkeys(item_ids))
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            items = executor.map(get_item, unique_ids)
+            return {
+                item_id: item 
+                for item_id, item in zip(unique_ids, items) 
+                if item is not None
+            }
+    
+    def delete_items_bulk(self, item_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several items using batch HTTP requests.
+        
+        Clients without batched deletion call ``delete_item`` concurrently
+        on up to ``MAX_WORKERS`` threads instead.
+        
+        Args:
+            item_ids: Unique identifiers for the items
+        
+        Returns:
+            Mapping of item ID to whether its deletion was successful
+        """
+        if self._delete_request is None:
+            return self._delete_items_concurrently(item_ids)
+        
+        deleted = self._execute_batch({
+            item_id: self._delete_request(item_id) for item_id in item_ids
+        })
+        return {item_id: item_id in deleted for item_id in item_ids}
+    
+    def _delete_items_concurrently(self, item_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several items with ``delete_item`` on a pool of threads.
+        
+        Args:
+            item_ids: Unique identifiers for the items
+        
+        Returns:
+            Mapping of item ID to whether its deletion was successful
+        """
+        def delete_item(item_id: str) -> bool:
+            try:
+                return bool(self.delete_item(item_id))
+            except HttpError:
+                # Already logged by handle_api_error
+                return False
+        
+        unique_ids = list(dict.fromkeys(item_ids))
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            deleted = dict(zip(unique_ids, executor.map(delete_item, unique_ids)))
+        return {item_id: deleted[item_id] for item_id in item_ids}
+    
+    async def alist_items(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Asynchronous variant of ``list_items``.
+        
+        The underlying API call blocks, so it runs in a worker thread; this
+        lets calls to several services be awaited together with
+        ``asyncio.gather``.
+        
+        Returns:
+            List of items
+        """
+        return await asyncio.to_thread(self.list_items, *args, **kwargs)
+    
+    async def acreate_item(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Asynchronous variant of ``create_item``.
+        
+        Returns:
+            Created item details
+        """
+        return await asyncio.to_thread(self.create_item, *args, **kwargs)
+    
+    async def aget_item(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Asynchronous variant of ``get_item``.
+        
+        Returns:
+            Item details
+        """
+        return await asyncio.to_thread(self.get_item, *args, **kwargs)
+    
+    async def aupdate_item(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Asynchronous variant of ``update_item``.
+        
+        Returns:
+            Updated item details
+        """
+        return await asyncio.to_thread(self.update_item, *args, **kwargs)
+    
+    async def adelete_item(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Asynchronous variant of ``delete_item``.
+        
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.delete_item, *args, **kwargs)
+    
+    async def aget_items_bulk(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Asynchronous variant of ``get_items_bulk``.
+        
+        Returns:
+            Item details keyed by item ID
+        """
+        return await asyncio.to_thread(self.get_items_bulk, item_ids)
+    
     def handle_api_error(self, error: HttpError) -> None:
         """
         Handle and log Google API errors.
@@ -144,9 +935,12 @@ class BaseServiceClient(ABC):
             self._logger.warning("Permission denied. Check OAuth scopes.")
         elif error.resp.status == 404:
             self._logger.warning("Resource not found.")
+        elif error.resp.status in RETRYABLE_STATUSES:
+            # The transport already retried these with backoff
+            self._logger.warning(f"Request still failing after {self.MAX_RETRIES} retries.")
         
         # Re-raise the original error
-        raise
+        raise error
     
     def __repr__(self) -> str:
         """
@@ -6,7 +6,7 @@ spreadsheet and worksheet management operations.
 """
 
 from typing import List, Dict, Any, Optional, Union
-import os
+import functools
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
@@ -20,41 +20,70 @@ class SheetsClient(BaseServiceClient):
     Provides methods for spreadsheet and worksheet-related operations.
     """
     
-    def __init__(self, credentials: Credentials):
+    # Drive query selecting Google Sheets spreadsheets
+    LIST_QUERY = "mimeType='application/vnd.google-apps.spreadsheet'"
+    
+    def __init__(self, 
+                 credentials: Credentials, 
+                 http: Optional[Any] = None):
         """
         Initialize Sheets service client.
         
         Args:
             credentials: Google OAuth 2.0 credentials
+            http: Optional authorized transport shared with other clients
         """
         super().__init__(
             credentials=credentials, 
             service_name='sheets',
-            service_version='v4'
+            service_version='v4',
+            http=http
         )
     
+    @functools.cached_property
+    def _drive_service(self) -> Any:
+        """
+        Drive service used for listing and deleting spreadsheets, built on first use.
+        
+        Returns:
+            Drive v3 service resource
+        """
+        return self._build_service('drive', 'v3')
+    
     def list_items(self, 
-                   max_results: Optional[int] = 10) -> List[Dict[str, Any]]:
+                   max_results: Optional[int] = 10,
+                   fields: str = 'files(id,name,modifiedTime,owners),nextPageToken',
+                   include_shared_drives: bool = False,
+                   max_pages: Optional[int] = 1) -> List[Dict[str, Any]]:
         """
-        List spreadsheets in the user's Google Drive.
+        List spreadsheets in the user's Google Drive, most recently modified first.
         
         Args:
             max_results: Maximum number of spreadsheets to return
+            fields: Partial response mask selecting the fields to return
+            include_shared_drives: Whether to include spreadsheets on shared drives
+            max_pages: Maximum number of result pages to fetch, each of up
+                to max_results items (None for all pages)
         
         Returns:
             List of spreadsheet metadata
         """
         try:
-            # Create a separate Drive service
-            from googleapiclient.discovery import build
-            drive_service = build('drive', 'v3', credentials=self._credentials)
+            # Prepare request parameters
+            params = {
+                'pageSize': max_results,
+                'q': self.LIST_QUERY,
+                'fields': fields,
+                'orderBy': 'modifiedTime desc'
+            }
+            if include_shared_drives:
+                params['supportsAllDrives'] = True
+                params['includeItemsFromAllDrives'] = True
             
-            results = drive_service.files().list(
-                pageSize=max_results,
-                q="mimeType='application/vnd.google-apps.spreadsheet'"
-            ).execute()
+            files = self._drive_service.files()
+            request = files.list(**params)
             
-            return results.get('files', [])
+            return list(self._paginate(files, request, 'files', max_pages))
         
         except HttpError as error:
             self.handle_api_error(error)
@@ -70,9 +99,12 @@ class SheetsClient(BaseServiceClient):
             Detailed spreadsheet information
         """
         try:
-            spreadsheet = self._service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
+            spreadsheet = self._single_flight(
+                ('get', spreadsheet_id), 
+                lambda: self._collection('spreadsheets').get(
+                    spreadsheetId=spreadsheet_id
+                ).execute()
+            )
             
             return spreadsheet
         
@@ -107,7 +139,7 @@ class SheetsClient(BaseServiceClient):
                 ]
             
             # Create spreadsheet
-            spreadsheet = self._service.spreadsheets().create(
+            spreadsheet = self._collection('spreadsheets').create(
                 body=spreadsheet_body
             ).execute()
             
@@ -129,23 +161,37 @@ class SheetsClient(BaseServiceClient):
         Returns:
             Updated spreadsheet metadata
         """
-        try:
-            # Prepare batch update request
-            batch_update_request = {
-                'requests': [
-                    {
-                        'updateSpreadsheetProperties': {
-                            'properties': update_data,
-                            'fields': ','.join(update_data.keys())
-                        }
-                    }
-                ]
+        # Prepare update properties request
+        request = {
+            'updateSpreadsheetProperties': {
+                'properties': update_data,
+                'fields': ','.join(update_data.keys())
             }
-            
-            # Execute batch update
-            response = self._service.spreadsheets().batchUpdate(
+        }
+        
+        # Execute batch update; it handles API errors itself
+        return self.batch_update(spreadsheet_id, [request])
+    
+    def batch_update(self, 
+                     spreadsheet_id: str, 
+                     requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply several changes to a spreadsheet in one request.
+        
+        Requests such as addSheet, updateCells or deleteRange are applied
+        in order and atomically: if one fails, none are applied.
+        
+        Args:
+            spreadsheet_id: Unique identifier for the spreadsheet
+            requests: List of update requests
+        
+        Returns:
+            Batch update response, with one reply per request
+        """
+        try:
+            response = self._collection('spreadsheets').batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                body=batch_update_request
+                body={'requests': requests}
             ).execute()
             
             return response
@@ -165,8 +211,7 @@ class SheetsClient(BaseServiceClient):
         """
         try:
             # Use Drive API to delete spreadsheet
-            drive_service = self._service.service_resources['drive']
-            drive_service.files().delete(fileId=spreadsheet_id).execute()
+            self._drive_service.files().delete(fileId=spreadsheet_id).execute()
             
             return True
         
@@ -187,7 +232,7 @@ class SheetsClient(BaseServiceClient):
             2D list of cell values
         """
         try:
-            result = self._service.spreadsheets().values().get(
+            result = self._collection('spreadsheets', 'values').get(
                 spreadsheetId=spreadsheet_id,
                 range=range_name
             ).execute()
@@ -200,7 +245,8 @@ class SheetsClient(BaseServiceClient):
     def write_values(self, 
                      spreadsheet_id: str, 
                      range_name: str, 
-                     values: List[List[Any]]) -> Dict[str, Any]:
+                     values: List[List[Any]], 
+                     value_input_option: str = 'RAW') -> Dict[str, Any]:
         """
         Write values to a specific range in a spreadsheet.
         
@@ -208,6 +254,7 @@ class SheetsClient(BaseServiceClient):
             spreadsheet_id: Unique identifier for the spreadsheet
             range_name: A1 notation range to write (e.g., 'Sheet1!A1:D10')
             values: 2D list of values to write
+            value_input_option: How input is interpreted, 'RAW' or 'USER_ENTERED'
         
         Returns:
             Update result metadata
@@ -217,10 +264,66 @@ class SheetsClient(BaseServiceClient):
                 'values': values
             }
             
-            result = self._service.spreadsheets().values().update(
+            result = self._collection('spreadsheets', 'values').update(
                 spreadsheetId=spreadsheet_id, 
                 range=range_name,
-                valueInputOption='RAW'
+                valueInputOption=value_input_option,
+                body=body
+            ).execute()
+            
+            return result
+        
+        except HttpError as error:
+            self.handle_api_error(error)
+    
+    def batch_read_values(self, 
+                          spreadsheet_id: str, 
+                          ranges: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read values from several ranges of a spreadsheet in one request.
+        
+        Args:
+            spreadsheet_id: Unique identifier for the spreadsheet
+            ranges: A1 notation ranges to read
+        
+        Returns:
+            Value ranges in the order requested, each with its 'range' and 'values'
+        """
+        try:
+            result = self._collection('spreadsheets', 'values').batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges
+            ).execute()
+            
+            return result.get('valueRanges', [])
+        
+        except HttpError as error:
+            self.handle_api_error(error)
+    
+    def batch_write_values(self, 
+                           spreadsheet_id: str, 
+                           data: List[Dict[str, Any]], 
+                           value_input_option: str = 'RAW') -> Dict[str, Any]:
+        """
+        Write values to several ranges of a spreadsheet in one request.
+        
+        Args:
+            spreadsheet_id: Unique identifier for the spreadsheet
+            data: Value ranges to write, each with a 'range' and 'values'
+            value_input_option: How input is interpreted, 'RAW' or 'USER_ENTERED'
+        
+        Returns:
+            Batch update result metadata
+        """
+        try:
+            body = {
+                'valueInputOption': value_input_option,
+                'data': data
+            }
+            
+            result = self._collection('spreadsheets', 'values').batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body=body
             ).execute()
             
             return result
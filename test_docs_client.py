@@ -1,36 +1,50 @@
+import logging
+
+import pytest
+
 from src.google_workspace_agent.docs_client import DocsClient
-from src.google_workspace_agent.auth import GoogleWorkspaceAuth
+from _auth_cache import get_shared_credentials, get_shared_http
+
+logger = logging.getLogger(__name__)
 
 def main():
     try:
-        # Authenticate first
-        auth = GoogleWorkspaceAuth()
-        credentials = auth.get_credentials()
+        # Authenticate first, reusing credentials shared across scripts
+        credentials = get_shared_credentials()
         
-        # Initialize Docs Client
-        docs_client = DocsClient(credentials)
+        # Initialize Docs Client on the shared transport
+        docs_client = DocsClient(credentials, http=get_shared_http())
         
         # Test listing recent documents (limit to 5)
         documents = docs_client.list_items(max_results=5)
         
-        print("Docs Client Test:")
-        print(f"Number of documents retrieved: {len(documents)}")
+        logger.info("Docs Client Test:")
+        logger.info(f"Number of documents retrieved: {len(documents)}")
         
         if documents:
-            print("\nRecent Documents:")
+            # Fetch details for every document in a single batch request
+            details = docs_client.get_items_bulk([doc.get('id') for doc in documents])
+            
+            logger.info("Recent Documents:")
             for doc in documents:
-                print(f"- {doc.get('name', 'Untitled Document')}")
+                logger.info(f"- {doc.get('name', 'Untitled Document')}")
                 
-                # Attempt to get more details if possible
-                try:
-                    doc_id = doc.get('id')
-                    doc_details = docs_client.get_item(doc_id)
-                    print(f"  Title: {doc_details.get('title', 'No Title')}")
-                except Exception as detail_error:
-                    print(f"  Could not fetch document details: {detail_error}")
+                doc_details = details.get(doc.get('id'))
+                if doc_details:
+                    logger.info(f"  Title: {doc_details.get('title', 'No Title')}")
+                else:
+                    logger.warning("  Could not fetch document details")
         
     except Exception as e:
-        print(f"Docs Client Test Failed: {e}")
+        logger.error(f"Docs Client Test Failed: {e}")
+
+@pytest.mark.smoke
+def test_live_docs():
+    """List a document from the real Docs API; run with ``pytest -m smoke``."""
+    docs_client = DocsClient(get_shared_credentials(), http=get_shared_http())
+    
+    assert isinstance(docs_client.list_items(max_results=1), list)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
@@ -1,35 +1,66 @@
+import asyncio
+import logging
+
+import pytest
+
 from src.google_workspace_agent.drive_client import DriveClient
-from src.google_workspace_agent.auth import GoogleWorkspaceAuth
+from _auth_cache import get_shared_credentials, get_shared_http
+
+logger = logging.getLogger(__name__)
 
-def main():
+# Upper bound on concurrent detail requests, to stay clear of Drive rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+async def fetch_details(drive_client, files):
+    """Fetch details for all files concurrently, returning errors in place of failures."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch(file_id):
+        async with semaphore:
+            return await drive_client.aget_item(file_id)
+    
+    return await asyncio.gather(
+        *[fetch(file['id']) for file in files],
+        return_exceptions=True
+    )
+
+async def main():
     try:
-        # Authenticate first
-        auth = GoogleWorkspaceAuth()
-        credentials = auth.get_credentials()
+        # Authenticate first, reusing credentials shared across scripts
+        credentials = get_shared_credentials()
         
-        # Initialize Drive Client
-        drive_client = DriveClient(credentials)
+        # Initialize Drive Client on the shared transport
+        drive_client = DriveClient(credentials, http=get_shared_http())
         
         # Test listing recent files (limit to 10)
         files = drive_client.list_items(max_results=10)
         
-        print("Drive Client Test:")
-        print(f"Number of files retrieved: {len(files)}")
+        logger.info("Drive Client Test:")
+        logger.info(f"Number of files retrieved: {len(files)}")
         
         if files:
-            print("\nRecent Files:")
-            for file in files:
-                print(f"- {file.get('name', 'Unnamed File')} (Type: {file.get('mimeType', 'Unknown')}, Modified: {file.get('modifiedTime', 'Unknown')})")
+            # Optional: Get more details about each file, all at once
+            details = await fetch_details(drive_client, files)
+            
+            logger.info("Recent Files:")
+            for file, file_details in zip(files, details):
+                logger.info(f"- {file.get('name', 'Unnamed File')} (Type: {file.get('mimeType', 'Unknown')}, Modified: {file.get('modifiedTime', 'Unknown')})")
                 
-                # Optional: Get more details about each file
-                try:
-                    file_details = drive_client.get_item(file['id'])
-                    print(f"  Web View Link: {file_details.get('webViewLink', 'No link available')}")
-                except Exception as detail_error:
-                    print(f"  Could not fetch file details: {detail_error}")
+                if isinstance(file_details, Exception):
+                    logger.warning(f"  Could not fetch file details: {file_details}")
+                else:
+                    logger.info(f"  Web View Link: {file_details.get('webViewLink', 'No link available')}")
         
     except Exception as e:
-        print(f"Drive Client Test Failed: {e}")
+        logger.error(f"Drive Client Test Failed: {e}")
+
+@pytest.mark.smoke
+def test_live_drive():
+    """List a file from the real Drive API; run with ``pytest -m smoke``."""
+    drive_client = DriveClient(get_shared_credentials(), http=get_shared_http())
+    
+    assert isinstance(drive_client.list_items(max_results=1), list)
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    asyncio.run(main())
@@ -1,30 +1,46 @@
+import logging
+
+import pytest
+
 from src.google_workspace_agent.gmail_client import GmailClient
-from src.google_workspace_agent.auth import GoogleWorkspaceAuth
+from _auth_cache import get_shared_credentials, get_shared_http
+
+logger = logging.getLogger(__name__)
 
 def main():
     try:
-        # Authenticate first
-        auth = GoogleWorkspaceAuth()
-        credentials = auth.get_credentials()
+        # Authenticate first, reusing credentials shared across scripts
+        credentials = get_shared_credentials()
         
-        # Initialize Gmail Client
-        gmail_client = GmailClient(credentials)
+        # Initialize Gmail Client on the shared transport
+        gmail_client = GmailClient(credentials, http=get_shared_http())
         
         # Test listing recent emails (limit to 5)
         emails = gmail_client.list_items(max_results=5)
         
-        print("Gmail Client Test:")
-        print(f"Number of emails retrieved: {len(emails)}")
+        logger.info("Gmail Client Test:")
+        logger.info(f"Number of emails retrieved: {len(emails)}")
         
         if emails:
-            print("\nRecent Emails:")
+            # Fetch full email details in a single batch request
+            full_emails = gmail_client.get_items_bulk([email['id'] for email in emails])
+            
+            logger.info("Recent Emails:")
             for email in emails:
-                # Fetch full email details
-                full_email = gmail_client.get_item(email['id'])
-                print(f"- Email ID: {email['id']}")
+                logger.info(f"- Email ID: {email['id']}")
+                if email['id'] not in full_emails:
+                    logger.warning("  Could not fetch email details")
         
     except Exception as e:
-        print(f"Gmail Client Test Failed: {e}")
+        logger.error(f"Gmail Client Test Failed: {e}")
+
+@pytest.mark.smoke
+def test_live_gmail():
+    """List an email from the real Gmail API; run with ``pytest -m smoke``."""
+    gmail_client = GmailClient(get_shared_credentials(), http=get_shared_http())
+    
+    assert isinstance(gmail_client.list_items(max_results=1), list)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
@@ -1,44 +1,65 @@
+import logging
+
+import pytest
+
 from src.google_workspace_agent.sheets_client import SheetsClient
-from src.google_workspace_agent.auth import GoogleWorkspaceAuth
+from _auth_cache import get_shared_credentials, get_shared_http
+
+logger = logging.getLogger(__name__)
 
 def main():
     try:
-        # Authenticate first
-        auth = GoogleWorkspaceAuth()
-        credentials = auth.get_credentials()
+        # Authenticate first, reusing credentials shared across scripts
+        credentials = get_shared_credentials()
         
-        # Initialize Sheets Client
-        sheets_client = SheetsClient(credentials)
+        # Initialize Sheets Client on the shared transport
+        sheets_client = SheetsClient(credentials, http=get_shared_http())
         
         # Test listing spreadsheets (limit to 5)
         spreadsheets = sheets_client.list_items(max_results=5)
         
-        print("Sheets Client Test:")
-        print(f"Number of spreadsheets retrieved: {len(spreadsheets)}")
+        logger.info("Sheets Client Test:")
+        logger.info(f"Number of spreadsheets retrieved: {len(spreadsheets)}")
         
         if spreadsheets:
-            print("\nRecent Spreadsheets:")
+            logger.info("Recent Spreadsheets:")
             for sheet in spreadsheets:
-                print(f"- {sheet.get('name', 'Untitled Spreadsheet')}")
+                logger.info(f"- {sheet.get('name', 'Untitled Spreadsheet')}")
                 
                 # Attempt to get more details and read values if possible
                 try:
                     sheet_id = sheet.get('id')
                     sheet_details = sheets_client.get_item(sheet_id)
                     
-                    # Try to read values from the first sheet
-                    first_sheet_name = sheet_details.get('sheets', [{}])[0].get('properties', {}).get('title', 'Sheet1')
-                    values = sheets_client.read_values(sheet_id, f'{first_sheet_name}!A1:D5')
+                    # Read sample values from every sheet in one request
+                    sheet_names = [
+                        tab.get('properties', {}).get('title', 'Sheet1')
+                        for tab in sheet_details.get('sheets', [{}])
+                    ]
+                    value_ranges = sheets_client.batch_read_values(
+                        sheet_id, 
+                        [f"'{name}'!A1:D5" for name in sheet_names]
+                    )
                     
-                    if values:
-                        print("  Sample Data:")
-                        for row in values:
-                            print(f"  {row}")
+                    for value_range in value_ranges:
+                        values = value_range.get('values', [])
+                        if values:
+                            logger.info(f"  Sample Data ({value_range.get('range')}):")
+                            for row in values:
+                                logger.info(f"  {row}")
                 except Exception as read_error:
-                    print(f"  Could not fetch sheet details or data: {read_error}")
+                    logger.warning(f"  Could not fetch sheet details or data: {read_error}")
         
     except Exception as e:
-        print(f"Sheets Client Test Failed: {e}")
+        logger.error(f"Sheets Client Test Failed: {e}")
+
+@pytest.mark.smoke
+def test_live_sheets():
+    """List a spreadsheet from the real Sheets API; run with ``pytest -m smoke``."""
+    sheets_client = SheetsClient(get_shared_credentials(), http=get_shared_http())
+    
+    assert isinstance(sheets_client.list_items(max_results=1), list)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the Google Workspace Agent test suite.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from googleapiclient.errors import HttpError
+
+@pytest.fixture(scope='session')
+def forbidden_http_error():
+    """Create a 403 HttpError shared by the API error handling tests."""
+    return HttpError(
+        resp=Mock(status=403, reason='Forbidden'), 
+        content=b'Permission denied'
+    )
+
+@pytest.fixture(scope='session')
+def not_found_http_error():
+    """Create a 404 HttpError shared by the missing item tests."""
+    return HttpError(
+        resp=Mock(status=404, reason='Not Found'), 
+        content=b'Not found'
+    )
@@ -3,41 +3,33 @@ Unit tests for Google Workspace authentication module.
 """
 
 import os
-import tempfile
 import pytest
+from unittest.mock import Mock, patch
+
+from google.auth.exceptions import RefreshError
+
 from google_workspace_agent.auth import GoogleWorkspaceAuth
 
 class TestGoogleWorkspaceAuth:
     @pytest.fixture
-    def temp_credentials_file(self):
+    def temp_credentials_file(self, tmp_path):
         """Create a temporary credentials file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_cred:
-            temp_cred.write('''{
+        temp_cred = tmp_path / 'credentials.json'
+        temp_cred.write_text('''{
                 "installed": {
                     "client_id": "test_client_id",
                     "client_secret": "test_client_secret",
                     "redirect_uris": ["http://localhost"]
                 }
             }''')
-            temp_cred_path = temp_cred.name
-        
-        yield temp_cred_path
-        
-        # Cleanup
-        if os.path.exists(temp_cred_path):
-            os.unlink(temp_cred_path)
+        return str(temp_cred)
     
     @pytest.fixture
-    def temp_token_file(self):
-        """Create a temporary token file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_token:
-            temp_token_path = temp_token.name
-        
-        yield temp_token_path
-        
-        # Cleanup
-        if os.path.exists(temp_token_path):
-            os.unlink(temp_token_path)
+    def temp_token_file(self, tmp_path):
+        """Create an empty temporary token file for testing."""
+        temp_token = tmp_path / 'token.json'
+        temp_token.touch()
+        return str(temp_token)
     
     def test_initialization(self, temp_credentials_file):
         """Test authentication class initialization."""
@@ -72,3 +64,112 @@ class TestGoogleWorkspaceAuth:
         
         assert not os.path.exists(temp_token_file)
         assert auth.credentials is None
+    
+    def test_authenticate_reuses_valid_credentials(self, temp_token_file):
+        """Test that valid in-memory credentials skip the token file."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        auth.credentials = Mock(valid=True)
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls:
+            assert auth.authenticate() is auth.credentials
+            mock_creds_cls.from_authorized_user_file.assert_not_called()
+        
+        assert os.path.getsize(temp_token_file) == 0
+    
+    def test_authenticate_does_not_rewrite_valid_token(self, temp_token_file):
+        """Test that a valid token loaded from disk is not written back."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        loaded = Mock(valid=True, expired=False)
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls:
+            mock_creds_cls.from_authorized_user_file.return_value = loaded
+            assert auth.authenticate() is loaded
+        
+        loaded.to_json.assert_not_called()
+        assert auth.credentials is loaded
+    
+    def test_authenticate_refreshes_expired_token(self, temp_token_file):
+        """Test that an expired token is refreshed and persisted."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        loaded = Mock(valid=False, expired=True, refresh_token='refresh')
+        loaded.to_json.return_value = '{"token": "new"}'
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls:
+            mock_creds_cls.from_authorized_user_file.return_value = loaded
+            auth.authenticate()
+        
+        loaded.refresh.assert_called_once()
+        with open(temp_token_file) as f:
+            assert f.read() == '{"token": "new"}'
+    
+    def test_authenticate_reauthenticates_when_refresh_fails(self, temp_token_file):
+        """Test that a revoked refresh token falls back to the installed-app flow."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        loaded = Mock(valid=False, expired=True, refresh_token='revoked')
+        loaded.refresh.side_effect = RefreshError('invalid_grant')
+        fresh = Mock(valid=True)
+        fresh.to_json.return_value = '{"token": "fresh"}'
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls, \
+             patch('google_auth_oauthlib.flow.InstalledAppFlow') as mock_flow_cls:
+            mock_creds_cls.from_authorized_user_file.return_value = loaded
+            mock_flow_cls.from_client_secrets_file.return_value.run_local_server.return_value = fresh
+            assert auth.authenticate() is fresh
+        
+        loaded.refresh.assert_called_once()
+        with open(temp_token_file) as f:
+            assert f.read() == '{"token": "fresh"}'
+    
+    def test_authenticate_reloads_token_changed_on_disk(self, temp_token_file):
+        """Test that a token file updated by another process is reloaded."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        first = Mock(valid=True, expired=False)
+        second = Mock(valid=True, expired=False)
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls:
+            mock_creds_cls.from_authorized_user_file.side_effect = [first, second]
+            assert auth.authenticate() is first
+            assert auth.authenticate() is first
+            
+            # Simulate another process rewriting the token
+            stat = os.stat(temp_token_file)
+            os.utime(temp_token_file, (stat.st_atime, stat.st_mtime + 10))
+            
+            assert auth.authenticate() is second
+            assert mock_creds_cls.from_authorized_user_file.call_count == 2
+    
+    def test_refreshed_token_replaces_file_atomically(self, temp_token_file):
+        """Test that the token is moved into place rather than rewritten."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        loaded = Mock(valid=False, expired=True, refresh_token='refresh')
+        loaded.to_json.return_value = '{"token": "new"}'
+        original_inode = os.stat(temp_token_file).st_ino
+        
+        with patch('google_workspace_agent.auth.Credentials') as mock_creds_cls:
+            mock_creds_cls.from_authorized_user_file.return_value = loaded
+            auth.authenticate()
+        
+        assert os.stat(temp_token_file).st_ino != original_inode
+        leftovers = [
+            name for name in os.listdir(os.path.dirname(temp_token_file))
+            if name.endswith('.tmp')
+        ]
+        assert leftovers == []
+    
+    def test_failed_token_write_keeps_previous_token(self, temp_token_file):
+        """Test that an error while writing leaves the old token intact."""
+        auth = GoogleWorkspaceAuth(token_path=temp_token_file)
+        with open(temp_token_file, 'w') as f:
+            f.write('{"token": "old"}')
+        broken = Mock()
+        broken.to_json.side_effect = RuntimeError('serialization failed')
+        
+        with pytest.raises(RuntimeError):
+            auth._save_token(broken)
+        
+        with open(temp_token_file) as f:
+            assert f.read() == '{"token": "old"}'
+        assert not any(
+            name.endswith('.tmp') 
+            for name in os.listdir(os.path.dirname(temp_token_file))
+        )
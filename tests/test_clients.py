@@ -0,0 +1,57 @@
+"""
+Unit tests shared by all Google Workspace service clients.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from google_workspace_agent.calendar_client import CalendarClient
+from google_workspace_agent.docs_client import DocsClient
+from google_workspace_agent.drive_client import DriveClient
+from google_workspace_agent.gmail_client import GmailClient
+from google_workspace_agent.sheets_client import SheetsClient
+
+# Each client with the service attribute and resource path its list_items uses
+CLIENT_LIST_RESOURCES = [
+    (CalendarClient, '_service', ('events',)),
+    (DocsClient, '_drive_service', ('files',)),
+    (DriveClient, '_service', ('files',)),
+    (GmailClient, '_service', ('users', 'messages')),
+    (SheetsClient, '_drive_service', ('files',))
+]
+
+class TestServiceClients:
+    @pytest.fixture(params=CLIENT_LIST_RESOURCES, ids=lambda param: param[0].__name__)
+    def list_resource(self, request):
+        """Create a client with mock services, and the resource it lists from."""
+        client_cls, service_attr, resource_path = request.param
+        
+        client = client_cls(Mock(spec=Credentials))
+        client._service = Mock()
+        client._drive_service = Mock()
+        
+        resource = getattr(client, service_attr)
+        for name in resource_path:
+            resource = getattr(resource, name)()
+        return client, resource
+    
+    def test_list_items_empty(self, list_resource):
+        """Test that an empty list response yields no items."""
+        client, resource = list_resource
+        resource.list.return_value.execute.return_value = {}
+        
+        assert client.list_items() == []
+    
+    def test_api_error_handling(self, list_resource, forbidden_http_error):
+        """Test error handling for API errors."""
+        client, resource = list_resource
+        
+        # Set up mock service method to raise HttpError
+        resource.list.return_value.execute.side_effect = forbidden_http_error
+        
+        # Verify that handle_api_error is called and re-raises the error
+        with pytest.raises(HttpError):
+            client.list_items()
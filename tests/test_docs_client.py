@@ -6,31 +6,39 @@ import pytest
 from unittest.mock import Mock, patch
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.errors import HttpError
 
 from google_workspace_agent.docs_client import DocsClient
 
+# Credentials are only passed through to the client, so one spec'd Mock
+# serves every test
+_FAKE_CREDS = Mock(spec=Credentials)
+
 class TestDocsClient:
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_credentials(self):
-        """Create a mock Credentials object."""
-        return Mock(spec=Credentials)
+        """Provide the shared mock Credentials object."""
+        return _FAKE_CREDS
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def docs_client(self, mock_credentials):
-        """Create a DocsClient instance for testing."""
-        with patch('googleapiclient.discovery.build') as mock_build:
-            mock_service = Mock()
-            mock_build.return_value = mock_service
-            
-            # Add mock drive service to service resources
-            mock_service.service_resources = {
-                'drive': Mock()
-            }
-            
-            client = DocsClient(mock_credentials)
-            client._service = mock_service
-            return client
+        """Create a DocsClient instance shared by the tests in this module."""
+        # The service is built offline from the bundled discovery document;
+        # each test then swaps in mock Docs and Drive services
+        return DocsClient(mock_credentials)
+    
+    @pytest.fixture(autouse=True)
+    def reset_docs_client(self, docs_client):
+        """Give each test fresh mock services and no state left by other tests."""
+        docs_client._service = Mock()
+        _FAKE_CREDS.reset_mock()
+        docs_client._drive_service = Mock()
+        docs_client._document_lengths.clear()
+        
+        # Drop attributes a test stubbed on the shared client
+        attributes = set(vars(docs_client))
+        yield
+        for name in set(vars(docs_client)) - attributes:
+            delattr(docs_client, name)
     
     def test_list_documents(self, docs_client):
         """Test listing documents."""
@@ -43,7 +51,7 @@ class TestDocsClient:
         }
         
         # Set up mock service method
-        docs_client._service.service_resources['drive'].files().list.return_value.execute.return_value = mock_list_response
+        docs_client._drive_service.files().list.return_value.execute.return_value = mock_list_response
         
         # Call list_items method
         documents = docs_client.list_items(max_results=2)
@@ -54,11 +62,23 @@ class TestDocsClient:
         assert documents[1]['name'] == 'Meeting Notes'
         
         # Verify service method was called with correct parameters
-        docs_client._service.service_resources['drive'].files().list.assert_called_once_with(
+        docs_client._drive_service.files().list.assert_called_once_with(
             pageSize=2,
-            q="mimeType='application/vnd.google-apps.document'"
+            q=DocsClient.LIST_QUERY,
+            fields='files(id,name,modifiedTime,mimeType),nextPageToken'
         )
     
+    def test_drive_service_built_once(self, docs_client):
+        """Test that the Drive service is built on first use and reused."""
+        del docs_client._drive_service
+        
+        with patch.object(DocsClient, '_build_service') as mock_build_service:
+            first = docs_client._drive_service
+            second = docs_client._drive_service
+        
+        assert first is second
+        mock_build_service.assert_called_once_with('drive', 'v3')
+    
     def test_get_document(self, docs_client):
         """Test retrieving a specific document metadata."""
         # Mock the get method response
@@ -112,6 +132,28 @@ class TestDocsClient:
         docs_client._service.documents().create.assert_called_once()
         docs_client._service.documents().batchUpdate.assert_called_once()
     
+    def test_create_document_inserts_content_once(self, docs_client):
+        """Test that initial content is sent as one ordered insertion."""
+        docs_client._service.documents().create.return_value.execute.return_value = {
+            'documentId': 'new_doc1',
+            'title': 'New Document'
+        }
+        
+        docs_client.create_item(
+            title='New Document', 
+            content=[{'text': 'First. '}, {'text': 'Second.'}]
+        )
+        
+        docs_client._service.documents().batchUpdate.assert_called_once_with(
+            documentId='new_doc1',
+            body={'requests': [{
+                'insertText': {
+                    'location': {'index': 1},
+                    'text': 'First. Second.'
+                }
+            }]}
+        )
+    
     def test_update_document(self, docs_client):
         """Test updating a document."""
         # Mock the batchUpdate method response
@@ -146,7 +188,7 @@ class TestDocsClient:
     def test_delete_document(self, docs_client):
         """Test deleting a document."""
         # Set up mock service method
-        docs_client._service.service_resources['drive'].files().delete.return_value.execute.return_value = None
+        docs_client._drive_service.files().delete.return_value.execute.return_value = None
         
         # Call delete_item method
         result = docs_client.delete_item('doc1')
@@ -155,7 +197,7 @@ class TestDocsClient:
         assert result is True
         
         # Verify service method was called with correct parameters
-        docs_client._service.service_resources['drive'].files().delete.assert_called_once_with(
+        docs_client._drive_service.files().delete.assert_called_once_with(
             fileId='doc1'
         )
     
@@ -190,17 +232,81 @@ class TestDocsClient:
             }]}
         )
     
-    def test_api_error_handling(self, docs_client):
-        """Test error handling for API errors."""
-        # Create a mock HTTP error
-        mock_error = HttpError(
-            resp=Mock(status=403, reason='Forbidden'), 
-            content=b'Permission denied'
+    def test_append_text_tracks_document_length(self, docs_client):
+        """Test that consecutive appends fetch the document length only once."""
+        # Mock the minimal document fetch
+        docs_client._service.documents().get.return_value.execute.return_value = {
+            'body': {'content': [{'endIndex': 1}, {'endIndex': 12}]}
+        }
+        docs_client._service.documents().batchUpdate.return_value.execute.return_value = {
+            'documentId': 'doc1'
+        }
+        
+        # Append text twice
+        docs_client.append_text('doc1', 'Hello')
+        docs_client.append_text('doc1', 'World')
+        
+        # Verify only the end indexes were fetched, and only once
+        docs_client._service.documents().get.assert_called_once_with(
+            documentId='doc1',
+            fields='body/content/endIndex'
         )
         
-        # Set up mock service method to raise HttpError
-        docs_client._service.service_resources['drive'].files().list.return_value.execute.side_effect = mock_error
+        # Verify the second append used the locally updated length
+        last_request = docs_client._service.documents().batchUpdate.call_args.kwargs['body']['requests'][0]
+        assert last_request['insertText']['location']['index'] == 17
+    
+    def test_document_lengths_evict_least_recently_used(self, docs_client):
+        """Test that the length cache stays bounded."""
+        with patch('google_workspace_agent.docs_client.DOCUMENT_LENGTH_CACHE_SIZE', 2):
+            docs_client._remember_length('doc1', 10)
+            docs_client._remember_length('doc2', 20)
+            
+            # Using doc1 makes doc2 the least recently used
+            assert docs_client._get_document_length('doc1') == 10
+            docs_client._remember_length('doc3', 30)
         
-        # Verify that handle_api_error is called and re-raises the error
-        with pytest.raises(HttpError):
-            docs_client.list_items()
+        assert list(docs_client._document_lengths) == ['doc1', 'doc3']
+    
+    def test_delete_items_bulk(self, docs_client, forbidden_http_error):
+        """Test deleting several documents one by one through Drive."""
+        def delete_file(fileId):
+            request = Mock()
+            if fileId == 'locked':
+                request.execute.side_effect = forbidden_http_error
+            return request
+        
+        docs_client._drive_service.files().delete.side_effect = delete_file
+        
+        # Call delete_items_bulk method
+        result = docs_client.delete_items_bulk(['doc1', 'locked', 'doc1'])
+        
+        # Verify each document was deleted once and the failure is reported
+        assert result == {'doc1': True, 'locked': False}
+        assert docs_client._drive_service.files().delete.call_count == 2
+    
+    def test_get_items_bulk(self, docs_client):
+        """Test retrieving several documents in one batch request."""
+        batch = Mock()
+        added = []
+        batch.add.side_effect = lambda request, request_id: added.append(request_id)
+        
+        def new_batch(callback):
+            batch.execute.side_effect = lambda: [
+                callback(request_id, {'documentId': request_id}, None)
+                for request_id in added
+            ]
+            return batch
+        
+        docs_client._service.new_batch_http_request.side_effect = new_batch
+        
+        # Call get_items_bulk method
+        result = docs_client.get_items_bulk(['doc1', 'doc2'])
+        
+        # Verify both documents came from a single batch round trip
+        assert result == {
+            'doc1': {'documentId': 'doc1'},
+            'doc2': {'documentId': 'doc2'}
+        }
+        batch.execute.assert_called_once()
+        docs_client._service.documents().get.assert_called_with(documentId='doc2')
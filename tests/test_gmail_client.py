@@ -2,8 +2,10 @@
 Unit tests for Gmail Service Client module.
 """
 
+import base64
 import pytest
-from unittest.mock import Mock, patch
+from email import message_from_bytes
+from unittest.mock import ANY, Mock, patch
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
@@ -19,13 +21,11 @@ class TestGmailClient:
     @pytest.fixture
     def gmail_client(self, mock_credentials):
         """Create a GmailClient instance for testing."""
-        with patch('googleapiclient.discovery.build') as mock_build:
-            mock_service = Mock()
-            mock_build.return_value = mock_service
-            
-            client = GmailClient(mock_credentials)
-            client._service = mock_service
-            return client
+        # The service is built offline from the bundled discovery document,
+        # then replaced with a mock
+        client = GmailClient(mock_credentials)
+        client._service = Mock()
+        return client
     
     def test_list_emails(self, gmail_client):
         """Test listing emails."""
@@ -51,7 +51,8 @@ class TestGmailClient:
         # Verify service method was called with correct parameters
         gmail_client._service.users().messages().list.assert_called_once_with(
             userId='me', 
-            maxResults=2
+            maxResults=2,
+            fields='messages(id,threadId),nextPageToken'
         )
     
     def test_get_email(self, gmail_client):
@@ -84,6 +85,23 @@ class TestGmailClient:
             format='full'
         )
     
+    def test_get_email_metadata(self, gmail_client):
+        """Test retrieving only selected headers of an email."""
+        # Call get_item method with the metadata format
+        gmail_client.get_item(
+            'email1', 
+            message_format='metadata', 
+            metadata_headers=['From', 'Subject']
+        )
+        
+        # Verify service method was called with correct parameters
+        gmail_client._service.users().messages().get.assert_called_once_with(
+            userId='me', 
+            id='email1', 
+            format='metadata', 
+            metadataHeaders=['From', 'Subject']
+        )
+    
     def test_send_email(self, gmail_client):
         """Test sending an email."""
         # Mock the send method response
@@ -105,8 +123,50 @@ class TestGmailClient:
         # Verify results
         assert sent_email['id'] == 'sent_email1'
         
-        # Verify service method was called
-        gmail_client._service.users().messages().send.assert_called_once()
+        # Verify the message was sent inline as base64url
+        gmail_client._service.users().messages().send.assert_called_once_with(
+            userId='me', 
+            body={'raw': ANY}
+        )
+    
+    def test_send_large_email_as_media_upload(self, gmail_client):
+        """Test that large messages are uploaded as raw RFC 822 bytes."""
+        with patch('google_workspace_agent.gmail_client.MEDIA_SEND_THRESHOLD', 64):
+            gmail_client.create_item(
+                to='recipient@example.com', 
+                subject='Test Subject', 
+                body='Long line of the email body.\n' * 10
+            )
+        
+        # Verify the message went out as media instead of a raw field
+        _, kwargs = gmail_client._service.users().messages().send.call_args
+        assert set(kwargs) == {'userId', 'media_body'}
+        media = kwargs['media_body']
+        assert media.mimetype() == 'message/rfc822'
+        assert not media.resumable()
+        
+        message = message_from_bytes(media.getbytes(0, media.size()))
+        assert message['To'] == 'recipient@example.com'
+        assert message.get_payload().startswith('Long line of the email body.')
+    
+    def test_send_html_email(self, gmail_client):
+        """Test sending an email with plain text and HTML alternatives."""
+        # Call create_item method with an HTML body
+        gmail_client.create_item(
+            to='recipient@example.com', 
+            subject='Test Subject', 
+            body='Test email body', 
+            html_body='<p>Test email body</p>'
+        )
+        
+        # Decode the raw message that was sent
+        raw_message = gmail_client._service.users().messages().send.call_args.kwargs['body']['raw']
+        message = message_from_bytes(base64.urlsafe_b64decode(raw_message))
+        
+        # Verify the message is multipart/alternative with both bodies
+        assert message.get_content_type() == 'multipart/alternative'
+        assert [part.get_content_type() for part in message.get_payload()] == ['text/plain', 'text/html']
+        assert message['To'] == 'recipient@example.com'
     
     def test_update_email_labels(self, gmail_client):
         """Test updating email labels."""
@@ -157,17 +217,65 @@ class TestGmailClient:
             id='email1'
         )
     
-    def test_api_error_handling(self, gmail_client):
-        """Test error handling for API errors."""
-        # Create a mock HTTP error
-        mock_error = HttpError(
-            resp=Mock(status=403, reason='Forbidden'), 
-            content=b'Permission denied'
+    def test_get_items_bulk(self, gmail_client):
+        """Test retrieving emails in batches of at most 100 requests."""
+        batches = []
+        
+        def new_batch(callback):
+            batch = Mock()
+            batch.requests = []
+            batch.add.side_effect = lambda request, request_id: batch.requests.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, {'id': request_id}, None)
+                for request_id in batch.requests
+            ]
+            batches.append(batch)
+            return batch
+        
+        gmail_client._service.new_batch_http_request.side_effect = new_batch
+        message_ids = [f'email{i}' for i in range(150)]
+        
+        # Call get_items_bulk method, skipping the rate limit waits
+        with patch('google_workspace_agent.service_client.time.sleep'):
+            result = gmail_client.get_items_bulk(message_ids)
+        
+        # Verify every email was fetched in two batch round trips
+        assert [len(batch.requests) for batch in batches] == [100, 50]
+        assert result == {message_id: {'id': message_id} for message_id in message_ids}
+        gmail_client._service.users().messages().get.assert_called_with(
+            userId='me', 
+            id='email149', 
+            format='full'
+        )
+    
+    def test_get_items_bulk_retries_rate_limited_parts(self, gmail_client):
+        """Test that batch parts rejected with a 429 are sent again."""
+        rate_limited = HttpError(
+            resp=Mock(status=429, reason='Too Many Requests'), 
+            content=b'Rate limit exceeded'
         )
+        batches = []
+        
+        def new_batch(callback):
+            batch = Mock()
+            batch.requests = []
+            batch.add.side_effect = lambda request, request_id: batch.requests.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, None, rate_limited) 
+                if request_id == 'email1' and len(batches) == 1 
+                else callback(request_id, {'id': request_id}, None)
+                for request_id in batch.requests
+            ]
+            batches.append(batch)
+            return batch
+        
+        gmail_client._service.new_batch_http_request.side_effect = new_batch
         
-        # Set up mock service method to raise HttpError
-        gmail_client._service.users().messages().list.return_value.execute.side_effect = mock_error
+        # Call get_items_bulk method
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            result = gmail_client.get_items_bulk(['email0', 'email1'])
         
-        # Verify that handle_api_error is called and re-raises the error
-        with pytest.raises(HttpError):
-            gmail_client.list_items()
+        # Verify only the rate-limited email was resent after a backoff
+        assert [batch.requests for batch in batches] == [['email0', 'email1'], ['email1']]
+        assert result == {'email0': {'id': 'email0'}, 'email1': {'id': 'email1'}}
+        mock_sleep.assert_called_once()
@@ -2,18 +2,21 @@
 Unit tests for Workspace Integration module.
 """
 
+import asyncio
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
 import json
 
 from google.oauth2.credentials import Credentials
 
-from google_workspace_agent.integration import WorkspaceIntegration
+from google_workspace_agent.integration import WorkspaceIntegration, AsyncWorkspaceIntegration
 from google_workspace_agent.auth import GoogleWorkspaceAuth
 from google_workspace_agent.llm_client import GroqLLMClient
 
 class TestWorkspaceIntegration:
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_credentials(self):
         """Create a mock GoogleWorkspaceAuth object."""
         mock_auth = Mock(spec=GoogleWorkspaceAuth)
@@ -21,20 +24,46 @@ class TestWorkspaceIntegration:
         mock_auth.get_credentials.return_value = mock_credentials
         return mock_auth
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_llm_client(self):
         """Create a mock GroqLLMClient."""
         return Mock(spec=GroqLLMClient)
     
-    @pytest.fixture
-    def workspace_integration(self, mock_credentials, mock_llm_client):
-        """Create a WorkspaceIntegration instance for testing."""
-        with patch('googleapiclient.discovery.build'):
-            integration = WorkspaceIntegration(
-                credentials=mock_credentials, 
-                llm_client=mock_llm_client
-            )
-            return integration
+    @pytest.fixture(scope='module')
+    def client_classes(self):
+        """Replace the service clients so tests can stub their results."""
+        with patch('google_workspace_agent.integration.GmailClient', autospec=True) as gmail, \
+             patch('google_workspace_agent.integration.CalendarClient', autospec=True) as calendar, \
+             patch('google_workspace_agent.integration.DriveClient', autospec=True) as drive, \
+             patch('google_workspace_agent.integration.SheetsClient', autospec=True) as sheets, \
+             patch('google_workspace_agent.integration.DocsClient', autospec=True) as docs:
+            yield [gmail, calendar, drive, sheets, docs]
+    
+    @pytest.fixture(scope='module')
+    def workspace_integration(self, mock_credentials, mock_llm_client, client_classes):
+        """Create a WorkspaceIntegration instance shared by the tests in this module."""
+        integration = WorkspaceIntegration(
+            credentials=mock_credentials, 
+            llm_client=mock_llm_client
+        )
+        yield integration
+        integration.close()
+    
+    @pytest.fixture(autouse=True)
+    def reset_workspace_integration(self, workspace_integration, mock_llm_client, client_classes):
+        """Give each test fresh mock clients and no state left by other tests."""
+        mock_llm_client.reset_mock(return_value=True, side_effect=True)
+        for client_class in client_classes:
+            # Keep the autospecced instance, so calls stay signature-checked
+            client_class.reset_mock()
+            client_class.return_value.reset_mock(return_value=True, side_effect=True)
+        workspace_integration.clear_intent_cache()
+        
+        # Drop the clients a test built and the attributes it stubbed
+        attributes = set(vars(workspace_integration))
+        yield
+        for name in set(vars(workspace_integration)) - attributes:
+            delattr(workspace_integration, name)
     
     def test_initialization(self, workspace_integration):
         """Test WorkspaceIntegration initialization."""
@@ -45,6 +74,32 @@ class TestWorkspaceIntegration:
         assert hasattr(workspace_integration, 'docs_client')
         assert hasattr(workspace_integration, 'llm_client')
     
+    def test_service_clients_built_on_first_use(self, mock_credentials, mock_llm_client):
+        """Test that only the service clients a request uses are built."""
+        with patch('google_workspace_agent.integration.GmailClient') as mock_gmail, \
+             patch('google_workspace_agent.integration.DocsClient') as mock_docs:
+            with WorkspaceIntegration(
+                credentials=mock_credentials, 
+                llm_client=mock_llm_client
+            ) as integration:
+                mock_gmail.assert_not_called()
+                
+                # Repeated access reuses the client built first
+                assert integration.gmail_client is integration.gmail_client
+                mock_gmail.assert_called_once()
+                mock_docs.assert_not_called()
+    
+    def test_close_shuts_down_executor(self, mock_credentials, mock_llm_client):
+        """Test that leaving the context manager releases the worker threads."""
+        with WorkspaceIntegration(
+            credentials=mock_credentials, 
+            llm_client=mock_llm_client
+        ) as integration:
+            pass
+        
+        with pytest.raises(RuntimeError):
+            integration._executor.submit(time.sleep, 0)
+    
     def test_extract_intent_success(self, workspace_integration, mock_llm_client):
         """Test intent extraction with successful LLM response."""
         # Mock LLM response
@@ -65,19 +120,97 @@ class TestWorkspaceIntegration:
         assert intent['service'] == 'email'
         assert intent['action'] == 'send'
         assert intent['details']['to'] == 'test@example.com'
+        
+        # Verify the intent is requested in JSON mode, without streaming
+        _, kwargs = mock_llm_client.generate_response.call_args
+        assert kwargs['response_format'] == {'type': 'json_object'}
+        assert kwargs.get('stream', False) is False
     
     def test_extract_intent_parsing_failure(self, workspace_integration, mock_llm_client):
         """Test intent extraction with invalid JSON response."""
         # Mock LLM response with invalid JSON
         mock_llm_client.generate_response.return_value = "Invalid JSON"
         
-        # Call method
-        intent = workspace_integration._extract_intent("Complex request")
+        # Verify the failure is reported instead of guessing an intent
+        with pytest.raises(ValueError, match="Could not parse intent"):
+            workspace_integration._extract_intent("Complex request")
+    
+    def test_extract_intent_requests_json(self, workspace_integration, mock_llm_client):
+        """Test that intent extraction asks Groq for a JSON object."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'service': 'drive',
+            'action': 'list'
+        })
+        
+        workspace_integration._extract_intent("List the files I changed this week")
+        
+        _, kwargs = mock_llm_client.generate_response.call_args
+        assert kwargs['response_format'] == {'type': 'json_object'}
+    
+    def test_extract_intent_fast_path(self, workspace_integration, mock_llm_client):
+        """Test that simple commands are classified without the LLM."""
+        intent = workspace_integration._extract_intent(
+            "Create a new Google Docs document titled 'Q2 2025 Project Plan'"
+        )
+        
+        assert intent == {
+            'service': 'docs',
+            'action': 'create',
+            'details': {'title': 'Q2 2025 Project Plan'}
+        }
+        assert workspace_integration._extract_intent("Show my recent emails.")['service'] == 'email'
+        mock_llm_client.generate_response.assert_not_called()
+    
+    def test_extract_intent_is_cached(self, workspace_integration, mock_llm_client):
+        """Test that repeated requests reuse the extracted intent."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'service': 'drive',
+            'action': 'list',
+            'details': {}
+        })
+        
+        # Extract the same intent twice
+        first = workspace_integration._extract_intent("List the files I changed this week")
+        second = workspace_integration._extract_intent("List the files I changed this week")
+        
+        # Verify the LLM was only asked once
+        assert first == second
+        assert mock_llm_client.generate_response.call_count == 1
+        
+        # Verify clearing the cache asks the LLM again
+        workspace_integration.clear_intent_cache()
+        workspace_integration._extract_intent("List the files I changed this week")
+        assert mock_llm_client.generate_response.call_count == 2
+    
+    def test_extract_intent_cache_ignores_surrounding_whitespace(self, workspace_integration, mock_llm_client):
+        """Test that requests differing only in outer whitespace share a cache entry."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'service': 'drive',
+            'action': 'list',
+            'details': {}
+        })
+        
+        workspace_integration._extract_intent("List the files I changed this week")
+        workspace_integration._extract_intent("  List the files I changed this week\n")
         
-        # Verify fallback intent
-        assert intent['service'] == 'multi'
-        assert intent['action'] == 'interpret'
-        assert intent['details'] == 'Complex request'
+        mock_llm_client.generate_response.assert_called_once()
+        assert mock_llm_client.generate_response.call_args.kwargs['prompt'] == (
+            "List the files I changed this week"
+        )
+    
+    def test_extract_intent_does_not_cache_parsing_failure(self, workspace_integration, mock_llm_client):
+        """Test that an unparseable response is retried on the next request."""
+        mock_llm_client.generate_response.side_effect = [
+            "Invalid JSON", 
+            json.dumps({'service': 'drive', 'action': 'list', 'details': {}})
+        ]
+        
+        with pytest.raises(ValueError):
+            workspace_integration._extract_intent("Complex request")
+        
+        # Verify the next attempt asks the LLM again
+        assert workspace_integration._extract_intent("Complex request")['service'] == 'drive'
+        assert mock_llm_client.generate_response.call_count == 2
     
     def test_handle_email_request(self, workspace_integration, mock_llm_client):
         """Test handling an email request."""
@@ -110,6 +243,33 @@ class TestWorkspaceIntegration:
             body='Test Body'
         )
     
+    def test_handle_unsupported_action(self, workspace_integration):
+        """Test that unknown actions are reported instead of returning nothing."""
+        result = workspace_integration._handle_email_request({
+            'service': 'email',
+            'action': 'archive',
+            'details': {}
+        })
+        
+        assert result == {
+            'status': 'error',
+            'message': 'Unsupported email action: archive'
+        }
+    
+    def test_process_unsupported_service(self, workspace_integration, mock_llm_client):
+        """Test that intents for unknown services are rejected."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'service': 'slack',
+            'action': 'send'
+        })
+        
+        result = workspace_integration.process_natural_language_request("Post to Slack")
+        
+        assert result == {
+            'status': 'error',
+            'message': 'Unsupported service: slack'
+        }
+    
     def test_handle_multi_service_request(self, workspace_integration, mock_llm_client):
         """Test handling a multi-service request."""
         # Mock LLM breakdown response
@@ -155,6 +315,72 @@ class TestWorkspaceIntegration:
         assert result['results']['email']['result'] == mock_email_result
         assert result['results']['calendar']['result'] == mock_calendar_result
     
+    def test_handle_multi_service_request_uses_one_llm_call(self, workspace_integration, mock_llm_client):
+        """Test that sub-requests are dispatched without extracting their intent again."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'drive': {'action': 'list', 'details': {'max_results': 5}},
+            'docs': {'action': 'create', 'details': {'title': 'Notes'}}
+        })
+        
+        # Call method
+        result = workspace_integration._handle_multi_service_request({
+            'service': 'multi',
+            'details': 'List my files and create a notes document'
+        })
+        
+        # Verify only the decomposition call reached the LLM
+        assert result['status'] == 'success'
+        assert mock_llm_client.generate_response.call_count == 1
+        workspace_integration.drive_client.list_items.assert_called_once_with(
+            max_results=5, 
+            query=None
+        )
+    
+    def test_decompose_request_sends_structured_details_as_json(self, workspace_integration, mock_llm_client):
+        """Test that dict details reach the LLM as JSON, not a Python repr."""
+        mock_llm_client.generate_response.return_value = json.dumps({})
+        
+        workspace_integration._decompose_request({
+            'service': 'multi',
+            'details': {'email': 'to team', 'calendar': None}
+        })
+        
+        prompt = mock_llm_client.generate_response.call_args.kwargs['prompt']
+        assert json.loads(prompt) == {'email': 'to team', 'calendar': None}
+    
+    def test_handle_multi_service_request_with_actions(self, workspace_integration, mock_llm_client):
+        """Test that intents already holding per-service actions skip the LLM."""
+        result = workspace_integration._handle_multi_service_request({
+            'service': 'multi',
+            'actions': {
+                'docs': {'action': 'create', 'details': {'title': 'Notes'}}
+            }
+        })
+        
+        assert result['status'] == 'success'
+        mock_llm_client.generate_response.assert_not_called()
+        workspace_integration.docs_client.create_item.assert_called_once_with(
+            title='Notes', 
+            content=None
+        )
+    
+    def test_handle_multi_service_request_isolates_failures(self, workspace_integration, mock_llm_client):
+        """Test that one failing service doesn't fail the other services."""
+        workspace_integration.gmail_client.create_item.side_effect = RuntimeError('quota exceeded')
+        workspace_integration.docs_client.create_item.return_value = {'documentId': 'doc1'}
+        
+        result = workspace_integration._handle_multi_service_request({
+            'service': 'multi',
+            'actions': {
+                'email': {'action': 'send', 'details': {'to': 'test@example.com'}},
+                'docs': {'action': 'create', 'details': {'title': 'Notes'}}
+            }
+        })
+        
+        assert result['status'] == 'success'
+        assert result['results']['email'] == {'status': 'error', 'message': 'quota exceeded'}
+        assert result['results']['docs']['result'] == {'documentId': 'doc1'}
+    
     def test_process_natural_language_request(self, workspace_integration, mock_llm_client):
         """Test processing a complete natural language request."""
         # Mock intent extraction
@@ -180,3 +406,188 @@ class TestWorkspaceIntegration:
         # Verify results
         assert result['status'] == 'success'
         assert result['result'] == mock_send_result
+    
+    def test_process_intent_skips_llm(self, workspace_integration, mock_llm_client):
+        """Test that structured intents are dispatched without another LLM call."""
+        workspace_integration.drive_client.list_items.return_value = [{'id': 'file1'}]
+        
+        result = workspace_integration._process_intent({
+            'service': 'drive',
+            'action': 'list',
+            'details': {'max_results': 1}
+        })
+        
+        assert result == {'status': 'success', 'result': [{'id': 'file1'}]}
+        mock_llm_client.generate_response.assert_not_called()
+    
+    def test_batch_process_requests(self, workspace_integration, mock_llm_client):
+        """Test that a batch shares one intent extraction call and keeps order."""
+        mock_llm_client.generate_response.return_value = json.dumps({'intents': [
+            {'service': 'email', 'action': 'send', 'details': {'to': 'test@example.com'}},
+            {'service': 'slack', 'action': 'post', 'details': {}}
+        ]})
+        workspace_integration.gmail_client.create_item.return_value = {'id': 'sent_email_id'}
+        workspace_integration.drive_client.list_items.return_value = [{'id': 'file1'}]
+        
+        results = workspace_integration.batch_process_requests([
+            "Email test@example.com about the launch",
+            "List my files",
+            "Post the launch to Slack"
+        ])
+        
+        assert mock_llm_client.generate_response.call_count == 1
+        assert results[0] == {'status': 'success', 'result': {'id': 'sent_email_id'}}
+        assert results[1] == {'status': 'success', 'result': [{'id': 'file1'}]}
+        assert results[2] == {'status': 'error', 'message': 'Unsupported service: slack'}
+    
+    def test_batch_process_requests_misaligned_intents(self, workspace_integration, mock_llm_client):
+        """Test that a misaligned batch response fails only the LLM-classified requests."""
+        mock_llm_client.generate_response.return_value = json.dumps({'intents': []})
+        workspace_integration.drive_client.list_items.return_value = []
+        
+        results = workspace_integration.batch_process_requests([
+            "Email the team",
+            "Show my files",
+            "Book a meeting room"
+        ])
+        
+        assert results[0]['status'] == 'error'
+        assert results[1] == {'status': 'success', 'result': []}
+        assert results[2]['status'] == 'error'
+    
+    def test_aprocess_natural_language_request(self, workspace_integration):
+        """Test the async wrapper delegates to the synchronous pipeline."""
+        expected = {'status': 'success', 'result': {'id': 'sent_email_id'}}
+        
+        with patch.object(workspace_integration, 'process_natural_language_request', 
+                          return_value=expected) as mock_process:
+            result = asyncio.run(
+                workspace_integration.aprocess_natural_language_request("Send an email")
+            )
+        
+        assert result == expected
+        mock_process.assert_called_once_with("Send an email")
+
+class TestAsyncWorkspaceIntegration:
+    @pytest.fixture
+    def mock_llm_client(self):
+        """Create a mock GroqLLMClient."""
+        return Mock(spec=GroqLLMClient)
+    
+    @pytest.fixture
+    def async_integration(self, mock_llm_client):
+        """Create an AsyncWorkspaceIntegration instance for testing."""
+        mock_auth = Mock(spec=GoogleWorkspaceAuth)
+        mock_auth.get_credentials.return_value = Mock(spec=Credentials)
+        
+        with patch('google_workspace_agent.integration.GmailClient'), \
+             patch('google_workspace_agent.integration.DocsClient'):
+            integration = AsyncWorkspaceIntegration(
+                credentials=mock_auth, 
+                llm_client=mock_llm_client
+            )
+            yield integration
+            integration.close()
+    
+    def test_process_natural_language_request(self, async_integration, mock_llm_client):
+        """Test that single-service requests are dispatched to their handler."""
+        mock_llm_client.generate_response.return_value = json.dumps({
+            'service': 'email',
+            'action': 'send',
+            'details': {'to': 'test@example.com'}
+        })
+        async_integration.workspace.gmail_client.create_item.return_value = {'id': 'sent_email_id'}
+        
+        result = asyncio.run(
+            async_integration.process_natural_language_request("Send an email")
+        )
+        
+        assert result == {'status': 'success', 'result': {'id': 'sent_email_id'}}
+    
+    def test_handle_multi_service_request(self, async_integration):
+        """Test that sub-requests are gathered and failures stay isolated."""
+        workspace = async_integration.workspace
+        workspace.gmail_client.create_item.side_effect = RuntimeError('quota exceeded')
+        workspace.docs_client.create_item.return_value = {'documentId': 'doc1'}
+        
+        result = asyncio.run(async_integration._handle_multi_service_request({
+            'service': 'multi',
+            'actions': {
+                'email': {'action': 'send', 'details': {'to': 'test@example.com'}},
+                'docs': {'action': 'create', 'details': {'title': 'Notes'}},
+                'slack': {'action': 'post', 'details': {}}
+            }
+        }))
+        
+        assert result['status'] == 'success'
+        assert result['results']['email'] == {'status': 'error', 'message': 'quota exceeded'}
+        assert result['results']['docs']['result'] == {'documentId': 'doc1'}
+        assert result['results']['slack']['message'] == 'Unsupported service: slack'
+    
+    def test_max_concurrent_bounds_blocking_calls(self, mock_llm_client):
+        """Test that no more than max_concurrent calls run at once."""
+        mock_auth = Mock(spec=GoogleWorkspaceAuth)
+        mock_auth.get_credentials.return_value = Mock(spec=Credentials)
+        integration = AsyncWorkspaceIntegration(
+            credentials=mock_auth, 
+            llm_client=mock_llm_client, 
+            max_concurrent=2
+        )
+        
+        lock = threading.Lock()
+        running = []
+        peak = []
+        
+        def blocking_call(_):
+            with lock:
+                running.append(None)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+        
+        async def run_all():
+            async with integration:
+                await asyncio.gather(*[
+                    integration._run_blocking(blocking_call, position) 
+                    for position in range(6)
+                ])
+        
+        asyncio.run(run_all())
+        
+        assert len(peak) == 6
+        assert max(peak) == 2
+    
+    def test_usable_from_several_event_loops(self, mock_llm_client):
+        """Test that one instance can be awaited from successive event loops."""
+        mock_auth = Mock(spec=GoogleWorkspaceAuth)
+        mock_auth.get_credentials.return_value = Mock(spec=Credentials)
+        integration = AsyncWorkspaceIntegration(
+            credentials=mock_auth, 
+            llm_client=mock_llm_client, 
+            max_concurrent=1
+        )
+        
+        async def run_all():
+            # More calls than workers, so some of them have to wait
+            return await asyncio.gather(*[
+                integration._run_blocking(time.sleep, 0.01) 
+                for _ in range(3)
+            ])
+        
+        assert asyncio.run(run_all()) == [None, None, None]
+        assert asyncio.run(run_all()) == [None, None, None]
+        integration.close()
+    
+    def test_close_releases_worker_threads(self, async_integration):
+        """Test that closing shuts down both the async and the wrapped pools."""
+        async def use_and_close():
+            async with async_integration:
+                await async_integration._run_blocking(time.sleep, 0)
+        
+        asyncio.run(use_and_close())
+        
+        with pytest.raises(RuntimeError):
+            async_integration._executor.submit(time.sleep, 0)
+        with pytest.raises(RuntimeError):
+            async_integration.workspace._executor.submit(time.sleep, 0)
@@ -57,6 +57,20 @@ class TestGroqLLMClient:
         assert len(context.messages) == 3
         assert context.messages[0]["content"] == "Message 2"
     
+    def test_context_max_length_bounds_initial_messages(self):
+        """Test that a seeded history is trimmed and stays bounded."""
+        context = ConversationContext(
+            messages=[{"role": "user", "content": f"Message {i}"} for i in range(5)],
+            max_context_length=3
+        )
+        
+        assert [m["content"] for m in context.messages] == ["Message 2", "Message 3", "Message 4"]
+        
+        context.add_message("assistant", "Reply")
+        
+        assert len(context.messages) == 3
+        assert context.messages[0]["content"] == "Message 3"
+    
     @patch('groq.Groq')
     def test_generate_response(self, mock_groq, mock_env):
         """Test response generation."""
@@ -75,6 +89,64 @@ class TestGroqLLMClient:
         assert response == "Test response"
         assert len(client.context.messages) == 2
     
+    @patch('google_workspace_agent.llm_client.Groq')
+    def test_generate_response_with_response_format(self, mock_groq, mock_env):
+        """Test that a structured output mode is forwarded to Groq."""
+        mock_create = mock_groq.return_value.chat.completions.create
+        mock_create.return_value.choices = [
+            MagicMock(message=MagicMock(content='{"service": "drive"}'))
+        ]
+        
+        client = GroqLLMClient()
+        response = client.generate_response(
+            "List my files", 
+            response_format={'type': 'json_object'}
+        )
+        
+        assert response == '{"service": "drive"}'
+        _, kwargs = mock_create.call_args
+        assert kwargs['response_format'] == {'type': 'json_object'}
+    
+    @patch('google_workspace_agent.llm_client.Groq')
+    def test_generate_response_without_context(self, mock_groq, mock_env):
+        """Test that stateless calls neither send nor record history."""
+        mock_create = mock_groq.return_value.chat.completions.create
+        mock_create.return_value.choices = [
+            MagicMock(message=MagicMock(content="Stateless response"))
+        ]
+        
+        client = GroqLLMClient()
+        client.context.add_message("user", "Earlier message")
+        client.generate_response("Test prompt", use_context=False)
+        
+        _, kwargs = mock_create.call_args
+        assert kwargs['messages'] == [{"role": "user", "content": "Test prompt"}]
+        assert len(client.context.messages) == 1
+    
+    @patch('google_workspace_agent.llm_client.Groq')
+    def test_generate_response_streaming_stops_at_target(self, mock_groq, mock_env):
+        """Test that streaming stops reading once enough text has arrived."""
+        chunks = [
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+            for text in ["Short ", "summary ", "of long ", "text"]
+        ]
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(chunks)
+        mock_groq.return_value.chat.completions.create.return_value = stream
+        
+        client = GroqLLMClient()
+        response = client.generate_response(
+            "Test prompt", 
+            use_context=False, 
+            stream=True, 
+            target_length=10
+        )
+        
+        assert response == "Short summary "
+        stream.close.assert_called_once()
+        _, kwargs = mock_groq.return_value.chat.completions.create.call_args
+        assert kwargs['stream'] is True
+    
     def test_summarize_text(self, mock_env):
         """Test text summarization."""
         with patch.object(GroqLLMClient, 'generate_response', 
@@ -84,6 +156,32 @@ class TestGroqLLMClient:
             
             assert len(summary) <= 20
             mock_generate.assert_called_once()
+            assert mock_generate.call_args.kwargs['model'] == GroqLLMClient.SUMMARIZATION_MODEL
+    
+    @patch('google_workspace_agent.llm_client.Groq')
+    def test_generate_response_model_override(self, mock_groq, mock_env):
+        """Test that a per-call model replaces the client's model."""
+        mock_create = mock_groq.return_value.chat.completions.create
+        mock_create.return_value.choices = [
+            MagicMock(message=MagicMock(content="Summary"))
+        ]
+        
+        client = GroqLLMClient()
+        client.generate_response("Test prompt", use_context=False, model='llama-3.1-8b-instant')
+        client.generate_response("Test prompt", use_context=False)
+        
+        models = [kwargs['model'] for _, kwargs in mock_create.call_args_list]
+        assert models == ['llama-3.1-8b-instant', 'llama2-70b-4096']
+    
+    def test_summarize_text_caps_generated_tokens(self, mock_env):
+        """Test that summaries request only as many tokens as their length needs."""
+        with patch.object(GroqLLMClient, 'generate_response', 
+                          return_value="Summary") as mock_generate:
+            client = GroqLLMClient()
+            client.summarize_text("Long text to summarize", max_length=300)
+        
+        _, kwargs = mock_generate.call_args
+        assert kwargs['max_tokens'] == 108
     
     def test_reset_context(self, mock_env):
         """Test context reset."""
@@ -0,0 +1,429 @@
+"""
+Unit tests for the base service client module.
+"""
+
+import socket
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock, patch
+
+import orjson
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from google_workspace_agent.drive_client import DriveClient
+from google_workspace_agent.gmail_client import GmailClient
+from google_workspace_agent.service_client import (
+    _OrjsonModel, 
+    _PacedHttp, 
+    _ResponseCache, 
+    _ThreadLocalHttp, 
+    _TokenBucket, 
+    _load_discovery_document,
+    _read_discovery_document,
+    create_authorized_http
+)
+
+class TestThreadLocalHttp:
+    @pytest.fixture
+    def mock_credentials(self):
+        """Create a mock Credentials object."""
+        return Mock(spec=Credentials)
+    
+    def test_reuses_connection_within_thread(self, mock_credentials):
+        """Test that one thread keeps using the same authorized connection."""
+        http = _ThreadLocalHttp(mock_credentials)
+        
+        assert http._get_http() is http._get_http()
+        assert http.credentials is mock_credentials
+    
+    def test_separate_connection_per_thread(self, mock_credentials):
+        """Test that each thread gets its own authorized connection."""
+        http = _ThreadLocalHttp(mock_credentials)
+        connections = []
+        
+        def record():
+            connections.append(http._get_http())
+        
+        threads = [threading.Thread(target=record) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(connections) == 2
+        assert connections[0] is not connections[1]
+    
+    def test_request_delegates_to_thread_connection(self, mock_credentials):
+        """Test that requests are sent through the thread's connection."""
+        http = _ThreadLocalHttp(mock_credentials)
+        
+        with patch.object(http, '_get_http') as mock_get_http:
+            mock_resp = Mock(status=200)
+            mock_get_http.return_value.request.return_value = (mock_resp, b'{}')
+            
+            assert http.request('https://example.com', 'GET') == (mock_resp, b'{}')
+            mock_get_http.return_value.request.assert_called_once_with(
+                'https://example.com', 'GET'
+            )
+    
+    def test_refreshes_expired_token_once(self, mock_credentials):
+        """Test that an expired token is refreshed before the request."""
+        http = _ThreadLocalHttp(mock_credentials)
+        mock_credentials.valid = False
+        
+        def refresh(request):
+            mock_credentials.valid = True
+        
+        mock_credentials.refresh.side_effect = refresh
+        
+        with patch.object(http, '_get_http') as mock_get_http:
+            mock_get_http.return_value.request.return_value = (Mock(status=200), b'{}')
+            http.request('https://example.com')
+            http.request('https://example.com')
+        
+        mock_credentials.refresh.assert_called_once()
+    
+    def test_skips_refresh_for_valid_token(self, mock_credentials):
+        """Test that a valid token is used without refreshing."""
+        http = _ThreadLocalHttp(mock_credentials)
+        mock_credentials.valid = True
+        
+        with patch.object(http, '_get_http') as mock_get_http:
+            mock_get_http.return_value.request.return_value = (Mock(status=200), b'{}')
+            http.request('https://example.com')
+        
+        mock_credentials.refresh.assert_not_called()
+
+    def test_clients_share_transport(self, mock_credentials):
+        """Test that clients given one transport send requests through it."""
+        http = create_authorized_http(mock_credentials)
+        
+        gmail_client = GmailClient(mock_credentials, http=http)
+        drive_client = DriveClient(mock_credentials, http=http)
+        
+        assert gmail_client._http.transport is http
+        assert drive_client._http.transport is http
+        assert gmail_client._http._bucket is not drive_client._http._bucket
+
+class TestPacedHttp:
+    def test_retries_rate_limited_request(self):
+        """Test that 429 and 5xx responses are retried with backoff."""
+        transport = Mock()
+        transport.request.side_effect = [
+            (Mock(status=429), b''), 
+            (Mock(status=503), b''), 
+            (Mock(status=200), b'{}')
+        ]
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            resp, content = http.request('https://example.com')
+        
+        assert resp.status == 200
+        assert content == b'{}'
+        assert mock_sleep.call_count == 2
+    
+    def test_returns_last_response_when_retries_exhausted(self):
+        """Test that the final error response is returned after the last retry."""
+        transport = Mock()
+        transport.request.return_value = (Mock(status=503), b'')
+        http = _PacedHttp(transport, max_retries=1)
+        
+        with patch('google_workspace_agent.service_client.time.sleep'):
+            resp, _ = http.request('https://example.com')
+        
+        assert resp.status == 503
+        assert transport.request.call_count == 2
+    
+    def test_does_not_retry_post_after_server_error(self):
+        """Test that a POST answered with a 500 is not sent a second time."""
+        transport = Mock()
+        transport.request.return_value = (Mock(status=500), b'')
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            resp, _ = http.request('https://example.com', method='POST', body=b'{}')
+        
+        assert resp.status == 500
+        transport.request.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    def test_retries_rejected_post(self):
+        """Test that a POST turned away with a 429 is retried."""
+        transport = Mock()
+        transport.request.side_effect = [
+            (Mock(status=429), b''), 
+            (Mock(status=200), b'{}')
+        ]
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep'):
+            resp, _ = http.request('https://example.com', 'POST')
+        
+        assert resp.status == 200
+        assert transport.request.call_count == 2
+    
+    def test_retries_dropped_connection(self):
+        """Test that connection errors are retried like retryable statuses."""
+        transport = Mock()
+        transport.request.side_effect = [
+            ConnectionResetError('reset by peer'), 
+            (Mock(status=200), b'{}')
+        ]
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            resp, _ = http.request('https://example.com')
+        
+        assert resp.status == 200
+        mock_sleep.assert_called_once()
+    
+    def test_retries_socket_timeout(self):
+        """Test that socket timeouts are retried on every Python version."""
+        transport = Mock()
+        transport.request.side_effect = [
+            socket.timeout('timed out'), 
+            (Mock(status=200), b'{}')
+        ]
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep'):
+            resp, _ = http.request('https://example.com')
+        
+        assert resp.status == 200
+        assert transport.request.call_count == 2
+    
+    def test_does_not_retry_post_after_dropped_connection(self):
+        """Test that a POST whose connection dropped is not sent again."""
+        transport = Mock()
+        transport.request.side_effect = ConnectionResetError('reset by peer')
+        http = _PacedHttp(transport, max_retries=3)
+        
+        with patch('google_workspace_agent.service_client.time.sleep'), \
+             pytest.raises(ConnectionResetError):
+            http.request('https://example.com', method='POST', body=b'{}')
+        
+        transport.request.assert_called_once()
+    
+    def test_raises_connection_error_when_retries_exhausted(self):
+        """Test that the last transport error surfaces after the final retry."""
+        transport = Mock()
+        transport.request.side_effect = TimeoutError('timed out')
+        http = _PacedHttp(transport, max_retries=1)
+        
+        with patch('google_workspace_agent.service_client.time.sleep'), \
+             pytest.raises(TimeoutError):
+            http.request('https://example.com')
+        
+        assert transport.request.call_count == 2
+    
+    def test_delegates_transport_attributes(self):
+        """Test that transport attributes such as credentials are exposed."""
+        transport = Mock()
+        http = _PacedHttp(transport)
+        
+        assert http.credentials is transport.credentials
+
+class TestResponseCache:
+    @pytest.fixture
+    def etag_server(self):
+        """Serve a JSON resource that supports If-None-Match revalidation."""
+        seen_etags = []
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                seen_etags.append(self.headers.get('If-None-Match'))
+                if self.headers.get('If-None-Match') == '"v1"':
+                    self.send_response(304)
+                    self.send_header('ETag', '"v1"')
+                    self.end_headers()
+                    return
+                
+                body = b'{"id": "event1"}'
+                self.send_response(200)
+                self.send_header('ETag', '"v1"')
+                self.send_header('Cache-Control', 'private, max-age=0, must-revalidate')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        
+        # shutdown() waits for the next poll, which defaults to half a second
+        thread = threading.Thread(
+            target=server.serve_forever, 
+            kwargs={'poll_interval': 0.01}, 
+            daemon=True
+        )
+        thread.start()
+        yield f'http://127.0.0.1:{server.server_port}/events/event1', seen_etags
+        server.shutdown()
+        server.server_close()
+    
+    def test_revalidates_with_etag(self, etag_server):
+        """Test that repeated GETs send If-None-Match and reuse the cached body."""
+        uri, seen_etags = etag_server
+        credentials = Mock(spec=Credentials)
+        credentials.valid = True
+        http = _ThreadLocalHttp(credentials, cache=_ResponseCache())
+        
+        first_resp, first_content = http.request(uri, 'GET')
+        second_resp, second_content = http.request(uri, 'GET')
+        
+        assert seen_etags == [None, '"v1"']
+        assert second_resp.status == 200
+        assert second_resp.fromcache
+        assert second_content == first_content == b'{"id": "event1"}'
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the cache keeps at most max_entries responses."""
+        cache = _ResponseCache(max_entries=2)
+        cache.set('a', b'1')
+        cache.set('b', b'2')
+        cache.get('a')
+        cache.set('c', b'3')
+        
+        assert cache.get('a') == b'1'
+        assert cache.get('b') is None
+        assert cache.get('c') == b'3'
+
+class TestTokenBucket:
+    def test_allows_burst_up_to_rate(self):
+        """Test that a full bucket does not delay the first requests."""
+        bucket = _TokenBucket(rate=5)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            for _ in range(5):
+                bucket.acquire()
+        
+        mock_sleep.assert_not_called()
+    
+    def test_waits_when_bucket_is_empty(self):
+        """Test that requests beyond the burst wait for a refill."""
+        bucket = _TokenBucket(rate=5)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            for _ in range(6):
+                bucket.acquire()
+        
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 0.2
+    
+    def test_acquires_several_tokens_at_once(self):
+        """Test that a batch of requests takes one token per request."""
+        bucket = _TokenBucket(rate=5)
+        
+        with patch('google_workspace_agent.service_client.time.sleep') as mock_sleep:
+            bucket.acquire(4)
+            bucket.acquire(2)
+        
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 0.2
+
+class TestOrjsonModel:
+    def test_deserializes_json_bytes(self):
+        """Test that JSON responses are decoded into Python objects."""
+        model = _OrjsonModel()
+        
+        assert model.deserialize(b'{"id": "email1", "labelIds": ["INBOX"]}') == {
+            'id': 'email1', 
+            'labelIds': ['INBOX']
+        }
+    
+    def test_returns_text_for_invalid_json(self):
+        """Test that non-JSON responses are returned as text."""
+        model = _OrjsonModel()
+        
+        assert model.deserialize(b'not json') == 'not json'
+    
+    def test_unwraps_data_wrapper(self):
+        """Test that wrapped responses are unwrapped like JsonModel does."""
+        model = _OrjsonModel(data_wrapper=True)
+        
+        assert model.deserialize(b'{"data": {"id": "1"}}') == {'id': '1'}
+
+class TestDiscoveryDocuments:
+    @pytest.fixture
+    def mock_credentials(self):
+        """Create a mock Credentials object."""
+        return Mock(spec=Credentials)
+    
+    def test_discovery_document_is_read_once(self):
+        """Test that the bundled discovery document is cached after reading."""
+        document = _read_discovery_document('gmail', 'v1')
+        
+        assert orjson.loads(document)['name'] == 'gmail'
+        assert _read_discovery_document('gmail', 'v1') is document
+    
+    def test_builds_do_not_share_documents(self, mock_credentials):
+        """Test that building a service leaves later builds' documents untouched."""
+        client = GmailClient(mock_credentials)
+        pristine = _load_discovery_document('drive', 'v3')
+        
+        # Building a collection adds standard parameters to its methods
+        client._build_service('drive', 'v3').files()
+        
+        assert _load_discovery_document('drive', 'v3') == pristine
+        assert _load_discovery_document('drive', 'v3') is not _load_discovery_document('drive', 'v3')
+    
+    def test_clients_build_from_cached_document(self, mock_credentials):
+        """Test that clients are built from the cached discovery document."""
+        with patch('google_workspace_agent.service_client.build') as mock_build:
+            client = GmailClient(mock_credentials)
+        
+        mock_build.assert_not_called()
+        assert hasattr(client._service, 'users')
+    
+    def test_unknown_service_has_no_document(self):
+        """Test that services without a bundled document return None."""
+        assert _load_discovery_document('not-a-service', 'v0') is None
+    
+    def test_unbundled_document_is_fetched_once(self, mock_credentials):
+        """Test that documents for unbundled services are downloaded once."""
+        client = GmailClient(mock_credentials)
+        fetched = Mock(_rootDesc=_load_discovery_document('gmail', 'v1'))
+        
+        with patch('google_workspace_agent.service_client.build', 
+                   return_value=fetched) as mock_build:
+            first = client._build_service('unbundled-service', 'v1')
+            second = client._build_service('unbundled-service', 'v1')
+        
+        mock_build.assert_called_once()
+        assert first is fetched
+        assert hasattr(second, 'users')
+    
+    def test_collections_are_built_once(self, mock_credentials):
+        """Test that resource collections are reused across calls."""
+        client = GmailClient(mock_credentials)
+        
+        messages = client._collection('users', 'messages')
+        
+        assert client._collection('users', 'messages') is messages
+        assert hasattr(messages, 'list')
+    
+    def test_collections_follow_replaced_service(self, mock_credentials):
+        """Test that collections are rebuilt after the service is replaced."""
+        client = GmailClient(mock_credentials)
+        client._collection('users', 'messages')
+        
+        client._service = Mock()
+        
+        assert client._collection('users', 'messages') is client._service.users().messages()
+
+class TestHandleApiError:
+    def test_reraises_error_outside_except_block(self):
+        """Test that the given error is raised even when no exception is active."""
+        client = GmailClient(Mock(spec=Credentials))
+        error = HttpError(resp=Mock(status=503, reason='Unavailable'), content=b'')
+        
+        with pytest.raises(HttpError) as excinfo:
+            client.handle_api_error(error)
+        
+        assert excinfo.value is error
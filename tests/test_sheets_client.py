@@ -3,47 +3,149 @@ Unit tests for Sheets Service Client module.
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
 
 from google_workspace_agent.sheets_client import SheetsClient
 
+# Client calls that send one request and return the API response as is:
+# client method, its arguments, mocked collection, API method, API response
+# and the parameters the API method must be called with
+PASS_THROUGH_CASES = [
+    pytest.param(
+        'get_item', ('sheet1',), 
+        'spreadsheets', 'get', 
+        {
+            'spreadsheetId': 'sheet1',
+            'properties': {'title': 'Quarterly Report', 'locale': 'en_US'},
+            'sheets': [{'properties': {'title': 'Q1 2025'}}]
+        },
+        {'spreadsheetId': 'sheet1'},
+        id='get_spreadsheet'
+    ),
+    pytest.param(
+        'create_item', ('New Spreadsheet', [{'title': 'Sheet1'}, {'title': 'Sheet2'}]), 
+        'spreadsheets', 'create', 
+        {
+            'spreadsheetId': 'new_sheet1',
+            'properties': {'title': 'New Spreadsheet', 'locale': 'en_US'}
+        },
+        {
+            'body': {
+                'properties': {'title': 'New Spreadsheet'},
+                'sheets': [
+                    {'properties': {'title': 'Sheet1'}},
+                    {'properties': {'title': 'Sheet2'}}
+                ]
+            }
+        },
+        id='create_spreadsheet'
+    ),
+    pytest.param(
+        'update_item', ('sheet1', {'title': 'Updated Spreadsheet Title'}), 
+        'spreadsheets', 'batchUpdate', 
+        {'spreadsheetId': 'sheet1', 'replies': [{'updateSpreadsheetProperties': {}}]},
+        {
+            'spreadsheetId': 'sheet1',
+            'body': {
+                'requests': [{
+                    'updateSpreadsheetProperties': {
+                        'properties': {'title': 'Updated Spreadsheet Title'},
+                        'fields': 'title'
+                    }
+                }]
+            }
+        },
+        id='update_spreadsheet'
+    ),
+    pytest.param(
+        'write_values', ('sheet1', 'Sheet1!A1:C3', [['Name', 'Age'], ['Alice', '30']]), 
+        'spreadsheet_values', 'update', 
+        {'spreadsheetId': 'sheet1', 'updatedRange': 'Sheet1!A1:C3', 'updatedRows': 2},
+        {
+            'spreadsheetId': 'sheet1',
+            'range': 'Sheet1!A1:C3',
+            'valueInputOption': 'RAW',
+            'body': {'values': [['Name', 'Age'], ['Alice', '30']]}
+        },
+        id='write_values'
+    ),
+]
+
+# API responses shared by the tests, built once; the client only reads them
+LIST_RESPONSE = {
+    'files': [
+        {'id': 'sheet1', 'name': 'Quarterly Report'},
+        {'id': 'sheet2', 'name': 'Budget Tracker'}
+    ]
+}
+VALUES_RESPONSE = {
+    'values': [
+        ['Name', 'Age', 'City'],
+        ['Alice', '30', 'New York'],
+        ['Bob', '25', 'San Francisco']
+    ]
+}
+BATCH_GET_RESPONSE = {
+    'spreadsheetId': 'sheet1',
+    'valueRanges': [
+        {'range': 'Sheet1!A1:B1', 'values': [['Name', 'Age']]},
+        {'range': 'Sheet2!A1', 'values': [['Total']]}
+    ]
+}
+
 class TestSheetsClient:
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_credentials(self):
-        """Create a mock Credentials object."""
-        return Mock(spec=Credentials)
+        """Create stand-in credentials; the mocked service never uses them."""
+        return SimpleNamespace(
+            token=None, 
+            refresh_token=None, 
+            token_uri=None, 
+            client_id=None, 
+            client_secret=None, 
+            valid=True, 
+            expired=False
+        )
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sheets_client(self, mock_credentials):
-        """Create a SheetsClient instance for testing."""
-        with patch('googleapiclient.discovery.build') as mock_build:
-            mock_service = Mock()
-            mock_build.return_value = mock_service
-            
-            # Add mock drive service to service resources
-            mock_service.service_resources = {
-                'drive': Mock()
-            }
-            
-            client = SheetsClient(mock_credentials)
-            client._service = mock_service
-            return client
+        """Create a SheetsClient instance shared by the tests in this module."""
+        # The service is built offline from the bundled discovery document,
+        # then replaced with a mock
+        client = SheetsClient(mock_credentials)
+        client._service = Mock()
+        return client
     
-    def test_list_spreadsheets(self, sheets_client):
-        """Test listing spreadsheets."""
-        # Mock the list method response
-        mock_list_response = {
-            'files': [
-                {'id': 'sheet1', 'name': 'Quarterly Report'},
-                {'id': 'sheet2', 'name': 'Budget Tracker'}
-            ]
-        }
+    @pytest.fixture(autouse=True)
+    def reset_sheets_client(self, sheets_client):
+        """Clear the calls and side effects recorded by other tests."""
+        sheets_client._service.reset_mock(side_effect=True)
         
+        # Mock the Drive service used for listing and deleting
+        sheets_client._drive_service = Mock()
+    
+    @pytest.fixture
+    def spreadsheets(self, sheets_client):
+        """Mocked spreadsheets collection of the Sheets service."""
+        return sheets_client._service.spreadsheets.return_value
+    
+    @pytest.fixture
+    def spreadsheet_values(self, spreadsheets):
+        """Mocked spreadsheets.values collection of the Sheets service."""
+        return spreadsheets.values.return_value
+    
+    @pytest.fixture
+    def drive_files(self, sheets_client):
+        """Mocked files collection of the Drive service."""
+        return sheets_client._drive_service.files.return_value
+    
+    def test_list_spreadsheets(self, sheets_client, drive_files):
+        """Test listing spreadsheets."""
         # Set up mock service method
-        sheets_client._service.service_resources['drive'].files().list.return_value.execute.return_value = mock_list_response
+        drive_files.list.return_value.execute.return_value = LIST_RESPONSE
         
         # Call list_items method
         spreadsheets = sheets_client.list_items(max_results=2)
@@ -54,110 +156,120 @@ class TestSheetsClient:
         assert spreadsheets[1]['name'] == 'Budget Tracker'
         
         # Verify service method was called with correct parameters
-        sheets_client._service.service_resources['drive'].files().list.assert_called_once_with(
+        drive_files.list.assert_called_once_with(
             pageSize=2,
-            q="mimeType='application/vnd.google-apps.spreadsheet'"
+            q=SheetsClient.LIST_QUERY,
+            fields='files(id,name,modifiedTime,owners),nextPageToken',
+            orderBy='modifiedTime desc'
         )
     
-    def test_get_spreadsheet(self, sheets_client):
-        """Test retrieving a specific spreadsheet metadata."""
-        # Mock the get method response
-        mock_spreadsheet_response = {
-            'spreadsheetId': 'sheet1',
-            'properties': {
-                'title': 'Quarterly Report',
-                'locale': 'en_US'
-            },
-            'sheets': [
-                {'properties': {'title': 'Q1 2025'}}
-            ]
-        }
+    def test_list_spreadsheets_on_shared_drives(self, sheets_client, drive_files):
+        """Test that shared drives are only searched when asked for."""
+        drive_files.list.return_value.execute.return_value = {'files': []}
         
+        sheets_client.list_items(include_shared_drives=True)
+        
+        _, kwargs = drive_files.list.call_args
+        assert kwargs['supportsAllDrives'] is True
+        assert kwargs['includeItemsFromAllDrives'] is True
+    
+    @pytest.mark.parametrize(
+        'method, args, collection, api_method, response, expected_params', 
+        PASS_THROUGH_CASES
+    )
+    def test_pass_through_calls(self, request, sheets_client, 
+                                method, args, collection, api_method, 
+                                response, expected_params):
+        """Test the calls that return the API response unchanged."""
         # Set up mock service method
-        sheets_client._service.spreadsheets().get.return_value.execute.return_value = mock_spreadsheet_response
+        api_call = getattr(request.getfixturevalue(collection), api_method)
+        api_call.return_value.execute.return_value = response
         
-        # Call get_item method
-        spreadsheet = sheets_client.get_item('sheet1')
+        # Call the client method
+        result = getattr(sheets_client, method)(*args)
         
         # Verify results
-        assert spreadsheet['spreadsheetId'] == 'sheet1'
-        assert spreadsheet['properties']['title'] == 'Quarterly Report'
+        assert result == response
         
         # Verify service method was called with correct parameters
-        sheets_client._service.spreadsheets().get.assert_called_once_with(
-            spreadsheetId='sheet1'
-        )
+        api_call.assert_called_once_with(**expected_params)
     
-    def test_create_spreadsheet(self, sheets_client):
-        """Test creating a new spreadsheet."""
-        # Mock the create method response
-        mock_create_response = {
-            'spreadsheetId': 'new_sheet1',
-            'properties': {
-                'title': 'New Spreadsheet',
-                'locale': 'en_US'
-            }
-        }
+    def test_get_items_bulk(self, sheets_client, spreadsheets, not_found_http_error):
+        """Test retrieving several spreadsheets concurrently."""
+        def get_spreadsheet(spreadsheetId):
+            request = Mock()
+            if spreadsheetId == 'missing':
+                request.execute.side_effect = not_found_http_error
+            else:
+                request.execute.return_value = {'spreadsheetId': spreadsheetId}
+            return request
         
-        # Set up mock service method
-        sheets_client._service.spreadsheets().create.return_value.execute.return_value = mock_create_response
+        spreadsheets.get.side_effect = get_spreadsheet
         
-        # Call create_item method
-        new_spreadsheet = sheets_client.create_item(
-            title='New Spreadsheet', 
-            sheets=[{'title': 'Sheet1'}, {'title': 'Sheet2'}]
-        )
+        # Call get_items_bulk method
+        result = sheets_client.get_items_bulk(['sheet1', 'missing', 'sheet2', 'sheet1'])
         
-        # Verify results
-        assert new_spreadsheet['spreadsheetId'] == 'new_sheet1'
-        assert new_spreadsheet['properties']['title'] == 'New Spreadsheet'
-        
-        # Verify service method was called with correct parameters
-        sheets_client._service.spreadsheets().create.assert_called_once_with(
-            body={
-                'properties': {'title': 'New Spreadsheet'},
-                'sheets': [
-                    {'properties': {'title': 'Sheet1'}},
-                    {'properties': {'title': 'Sheet2'}}
-                ]
-            }
-        )
+        # Verify found spreadsheets are returned and the missing one is left out
+        assert result == {
+            'sheet1': {'spreadsheetId': 'sheet1'},
+            'sheet2': {'spreadsheetId': 'sheet2'}
+        }
     
-    def test_update_spreadsheet(self, sheets_client):
-        """Test updating spreadsheet metadata."""
-        # Mock the batchUpdate method response
-        mock_update_response = {
+    def test_batch_update(self, sheets_client, spreadsheets):
+        """Test that several changes are sent in one request."""
+        spreadsheets.batchUpdate.return_value.execute.return_value = {
             'spreadsheetId': 'sheet1',
-            'replies': [{'updateSpreadsheetProperties': {}}]
+            'replies': [{'addSheet': {}}, {}, {}]
         }
+        requests = [
+            {'addSheet': {'properties': {'title': 'Summary'}}},
+            {'updateCells': {'range': {'sheetId': 0}, 'fields': 'userEnteredValue'}},
+            {'deleteRange': {'range': {'sheetId': 0}, 'shiftDimension': 'ROWS'}}
+        ]
         
-        # Set up mock service method
-        sheets_client._service.spreadsheets().batchUpdate.return_value.execute.return_value = mock_update_response
-        
-        # Call update_item method
-        update_data = {'title': 'Updated Spreadsheet Title'}
-        updated_spreadsheet = sheets_client.update_item('sheet1', update_data)
-        
-        # Verify results
-        assert updated_spreadsheet['spreadsheetId'] == 'sheet1'
+        # Call batch_update method
+        result = sheets_client.batch_update('sheet1', requests)
         
-        # Verify service method was called with correct parameters
-        sheets_client._service.spreadsheets().batchUpdate.assert_called_once_with(
+        # Verify all changes went out in a single call
+        assert len(result['replies']) == 3
+        spreadsheets.batchUpdate.assert_called_once_with(
             spreadsheetId='sheet1',
-            body={
-                'requests': [{
-                    'updateSpreadsheetProperties': {
-                        'properties': update_data,
-                        'fields': 'title'
-                    }
-                }]
-            }
+            body={'requests': requests}
         )
     
-    def test_delete_spreadsheet(self, sheets_client):
+    def test_update_spreadsheet_error_is_handled_once(self, sheets_client, spreadsheets, 
+                                                      forbidden_http_error):
+        """Test that a failed update is logged and re-raised a single time."""
+        spreadsheets.batchUpdate.return_value.execute.side_effect = forbidden_http_error
+        
+        with patch.object(sheets_client, 'handle_api_error', 
+                          side_effect=forbidden_http_error) as mock_handle:
+            with pytest.raises(HttpError):
+                sheets_client.update_item('sheet1', {'title': 'Renamed'})
+        
+        mock_handle.assert_called_once_with(forbidden_http_error)
+    
+    def test_delete_items_bulk(self, sheets_client, drive_files, forbidden_http_error):
+        """Test deleting several spreadsheets one by one through Drive."""
+        def delete_file(fileId):
+            request = Mock()
+            if fileId == 'locked':
+                request.execute.side_effect = forbidden_http_error
+            return request
+        
+        drive_files.delete.side_effect = delete_file
+        
+        # Call delete_items_bulk method
+        result = sheets_client.delete_items_bulk(['sheet1', 'locked', 'sheet2'])
+        
+        # Verify successes and the failure are reported per spreadsheet
+        assert result == {'sheet1': True, 'locked': False, 'sheet2': True}
+        assert drive_files.delete.call_count == 3
+    
+    def test_delete_spreadsheet(self, sheets_client, drive_files):
         """Test deleting a spreadsheet."""
         # Set up mock service method
-        sheets_client._service.service_resources['drive'].files().delete.return_value.execute.return_value = None
+        drive_files.delete.return_value.execute.return_value = None
         
         # Call delete_item method
         result = sheets_client.delete_item('sheet1')
@@ -166,23 +278,14 @@ class TestSheetsClient:
         assert result is True
         
         # Verify service method was called with correct parameters
-        sheets_client._service.service_resources['drive'].files().delete.assert_called_once_with(
+        drive_files.delete.assert_called_once_with(
             fileId='sheet1'
         )
     
-    def test_read_values(self, sheets_client):
+    def test_read_values(self, sheets_client, spreadsheet_values):
         """Test reading values from a spreadsheet range."""
-        # Mock the values().get method response
-        mock_values_response = {
-            'values': [
-                ['Name', 'Age', 'City'],
-                ['Alice', '30', 'New York'],
-                ['Bob', '25', 'San Francisco']
-            ]
-        }
-        
         # Set up mock service method
-        sheets_client._service.spreadsheets().values().get.return_value.execute.return_value = mock_values_response
+        spreadsheet_values.get.return_value.execute.return_value = VALUES_RESPONSE
         
         # Call read_values method
         values = sheets_client.read_values('sheet1', 'Sheet1!A1:C3')
@@ -193,53 +296,42 @@ class TestSheetsClient:
         assert values[2] == ['Bob', '25', 'San Francisco']
         
         # Verify service method was called with correct parameters
-        sheets_client._service.spreadsheets().values().get.assert_called_once_with(
+        spreadsheet_values.get.assert_called_once_with(
             spreadsheetId='sheet1',
             range='Sheet1!A1:C3'
         )
     
-    def test_write_values(self, sheets_client):
-        """Test writing values to a spreadsheet range."""
-        # Mock the values().update method response
-        mock_update_response = {
-            'spreadsheetId': 'sheet1',
-            'updatedRange': 'Sheet1!A1:C3',
-            'updatedRows': 3
-        }
-        
-        # Set up mock service method
-        sheets_client._service.spreadsheets().values().update.return_value.execute.return_value = mock_update_response
+    def test_batch_read_values(self, sheets_client, spreadsheet_values):
+        """Test reading several ranges in one request."""
+        spreadsheet_values.batchGet.return_value.execute.return_value = BATCH_GET_RESPONSE
         
-        # Call write_values method
-        values = [
-            ['Name', 'Age', 'City'],
-            ['Alice', '30', 'New York'],
-            ['Bob', '25', 'San Francisco']
-        ]
-        result = sheets_client.write_values('sheet1', 'Sheet1!A1:C3', values)
+        # Call batch_read_values method
+        value_ranges = sheets_client.batch_read_values('sheet1', ['Sheet1!A1:B1', 'Sheet2!A1'])
         
         # Verify results
-        assert result['spreadsheetId'] == 'sheet1'
-        assert result['updatedRange'] == 'Sheet1!A1:C3'
-        
-        # Verify service method was called with correct parameters
-        sheets_client._service.spreadsheets().values().update.assert_called_once_with(
-            spreadsheetId='sheet1', 
-            range='Sheet1!A1:C3',
-            valueInputOption='RAW'
+        assert value_ranges == BATCH_GET_RESPONSE['valueRanges']
+        spreadsheet_values.batchGet.assert_called_once_with(
+            spreadsheetId='sheet1',
+            ranges=['Sheet1!A1:B1', 'Sheet2!A1']
         )
     
-    def test_api_error_handling(self, sheets_client):
-        """Test error handling for API errors."""
-        # Create a mock HTTP error
-        mock_error = HttpError(
-            resp=Mock(status=403, reason='Forbidden'), 
-            content=b'Permission denied'
-        )
+    def test_batch_write_values(self, sheets_client, spreadsheet_values):
+        """Test writing several ranges in one request."""
+        spreadsheet_values.batchUpdate.return_value.execute.return_value = {
+            'spreadsheetId': 'sheet1',
+            'totalUpdatedCells': 3
+        }
+        data = [
+            {'range': 'Sheet1!A1:B1', 'values': [['Name', 'Age']]},
+            {'range': 'Sheet2!A1', 'values': [['=SUM(Sheet1!B:B)']]}
+        ]
         
-        # Set up mock service method to raise HttpError
-        sheets_client._service.service_resources['drive'].files().list.return_value.execute.side_effect = mock_error
+        # Call batch_write_values method
+        result = sheets_client.batch_write_values('sheet1', data)
         
-        # Verify that handle_api_error is called and re-raises the error
-        with pytest.raises(HttpError):
-            sheets_client.list_items()
+        # Verify results
+        assert result['totalUpdatedCells'] == 3
+        spreadsheet_values.batchUpdate.assert_called_once_with(
+            spreadsheetId='sheet1',
+            body={'valueInputOption': 'RAW', 'data': data}
+        )